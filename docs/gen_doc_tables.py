@@ -18,7 +18,8 @@ def make_observation_space_table():
     }
 
     bit_floor = 0
-    for record in records:
+    for part in records:
+        record = dict(part)
         record["max"] = f"0 - {record['max']}"
 
         bit_ceil = bit_floor + record["size"] - 1
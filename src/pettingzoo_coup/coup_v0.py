@@ -1,5 +1,6 @@
 """PettingZoo Coup v0 environment."""
 
 from pettingzoo_coup.env.env import env, raw_env
+from pettingzoo_coup.env.vector import CoupVecEnv
 
-__all__ = ["env", "raw_env"]
+__all__ = ["CoupVecEnv", "env", "raw_env"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
@@ -33,6 +34,12 @@ class Action:
     card: CARD | None = None
     block: tuple = field(default_factory=tuple)
 
+    # positions in ACTION, START_ACTION and BLOCK_ACTION, set once at import;
+    # -1 when the action is not in the list
+    idx: int = field(default=-1, init=False, repr=False, compare=False)
+    start_idx: int = field(default=-1, init=False, repr=False, compare=False)
+    block_idx: int = field(default=-1, init=False, repr=False, compare=False)
+
     def __repr__(self):
         return self.name
 
@@ -96,14 +103,39 @@ class ActionTypes:
 
 ACTION: ActionTypes = ActionTypes()
 
-START_ACTION: list[Action] = [
+START_ACTION: tuple[Action, ...] = tuple(
     action for action in ACTION if action.type in {ACT.SELF, ACT.TARGET}
-]
-BLOCK_ACTION: list[Action] = [action for action in ACTION if action.type == ACT.BLOCK]
+)
+BLOCK_ACTION: tuple[Action, ...] = tuple(
+    action for action in ACTION if action.type == ACT.BLOCK
+)
+
+LEN_START_ACTION: int = len(START_ACTION)
+LEN_BLOCK_ACTION: int = len(BLOCK_ACTION)
+
+ACTION_IDX: dict[Action, int] = {action: i for i, action in enumerate(ACTION)}
+START_ACTION_IDX: dict[Action, int] = {
+    action: i for i, action in enumerate(START_ACTION)
+}
+BLOCK_ACTION_IDX: dict[Action, int] = {
+    action: i for i, action in enumerate(BLOCK_ACTION)
+}
+
+for _attr, _table in (
+    ("idx", ACTION_IDX),
+    ("start_idx", START_ACTION_IDX),
+    ("block_idx", BLOCK_ACTION_IDX),
+):
+    for _action, _i in _table.items():
+        object.__setattr__(_action, _attr, _i)
+
+BLOCKED_BY: dict[Action, tuple[Action, ...]] = {
+    action: tuple(getattr(ACTION, name) for name in action.block) for action in ACTION
+}
 
 
 ActionTarget = tuple[Action, int]
-ActionMask = list[ActionTarget]
+ActionMask = Sequence[ActionTarget]
 ActionSpace = list[ActionTarget]
 
 
@@ -1,22 +1,25 @@
 """Card types and deck management."""
 
 import logging
-from collections import Counter
-from enum import Enum
+from enum import IntEnum
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
-class CARD(Enum):
-    """Card types in the Coup game."""
+class CARD(IntEnum):
+    """Card types in the Coup game.
 
-    AMBASSADOR = "Ambassador"
-    ASSASSIN = "Assassin"
-    CAPTAIN = "Captain"
-    CONTESSA = "Contessa"
-    DUKE = "Duke"
+    Values are the positions of the card types in per-card count arrays, so a
+    card indexes those arrays directly.
+    """
+
+    AMBASSADOR = 0
+    ASSASSIN = 1
+    CAPTAIN = 2
+    CONTESSA = 3
+    DUKE = 4
 
     def __repr__(self):
         return self.name
@@ -25,17 +28,26 @@ class CARD(Enum):
         return repr(self)
 
 
-def draw(deck: Counter[CARD]) -> CARD:
-    """Draw a random card from a deck."""
-    cards = list(deck.elements())
-    idx = np.random.randint(0, len(cards) - 1)
-    card = cards[idx]
+CARDS: tuple[CARD, ...] = tuple(CARD)
+NUM_CARDS: int = len(CARDS)
+
+# three-letter card names by card index, for compact rendering
+CARD_SHORT_NAMES: np.ndarray = np.array([str(card)[:3] for card in CARDS])
+
+
+def draw(deck: np.ndarray, rng: np.random.Generator) -> CARD:
+    """Draw a random card from a deck of per-card counts."""
+    cumulative = deck.cumsum()
+    total = cumulative[-1]
+
+    # the drawn position falls in the count range of exactly one card type
+    idx = np.searchsorted(cumulative, rng.integers(total), side="right")
+
+    logger.debug("Deck draw: total_cards=%d", total)
 
-    logger.debug("Deck draw: total_cards=%d", len(cards))
+    deck[idx] -= 1
 
-    deck[card] -= 1
-    if not deck[card]:
-        del deck[card]
+    card = CARDS[idx]
 
-    logger.debug("Drew card: %s", str(card))
+    logger.debug("Drew card: %s", card)
     return card
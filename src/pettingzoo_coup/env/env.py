@@ -2,23 +2,122 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
-from collections import Counter
-from dataclasses import replace
 
 import numpy as np
 from gymnasium import spaces
 from pettingzoo import AECEnv
 
 from pettingzoo_coup.env import action, state
-from pettingzoo_coup.env.action import ActionSpace
-from pettingzoo_coup.env.card import CARD, draw
-from pettingzoo_coup.env.player import AgentID, Player
+from pettingzoo_coup.env.action import (
+    ACT,
+    ACTION,
+    ACTION_IDX,
+    ActionMask,
+    ActionSpace,
+    ActionTarget,
+)
+from pettingzoo_coup.env.card import CARD, CARD_SHORT_NAMES, CARDS, NUM_CARDS, draw
+from pettingzoo_coup.env.player import HAND, RESERVED, REVEALED, AgentID, Player
 from pettingzoo_coup.env.tabulate import to_markdown
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def observation_box(num_players: int, max_card_count: int) -> spaces.Box:
+    """Build the observation space for a game shape, shared between envs.
+
+    Envs should use a copy so each one seeds and samples its own space. The
+    copies share the bounds, so these are read-only.
+    """
+
+    records = state.observation_space(num_players, max_card_count)
+
+    sizes = np.fromiter((record["size"] for record in records), dtype=np.intp)
+    maxes = np.fromiter((record["max"] for record in records), dtype=np.int8)
+    highs = np.repeat(maxes, sizes)
+
+    box = spaces.Box(low=0, high=highs, shape=highs.shape, dtype=np.int8)
+    box.low.flags.writeable = False
+    box.high.flags.writeable = False
+    return box
+
+
+@functools.lru_cache(maxsize=16)
+def turn_order(num_players: int) -> np.ndarray:
+    """Build the seats in turn order starting from each seat, shared between envs.
+
+    Row ``seat`` lists all seats clockwise from ``seat``. The array is read-only.
+    """
+
+    seats = np.arange(num_players, dtype=np.intp)
+    order = (seats[:, None] + seats[None, :]) % num_players
+    order.flags.writeable = False
+    return order
+
+
+@functools.lru_cache(maxsize=16)
+def action_index(num_players: int) -> dict[ActionTarget, int]:
+    """Map each (action, target) pair to its position in the action space.
+
+    The mapping is shared between envs, in action space order. Envs should use
+    a copy, which reuses the stored hashes of the actions.
+    """
+
+    return {act: i for i, act in enumerate(action.action_space(num_players))}
+
+
+@functools.lru_cache(maxsize=16)
+def action_index_table(num_players: int) -> np.ndarray:
+    """Build the action index table of a game shape, shared between envs.
+
+    The table is indexed by ``[ACTION_IDX[action], target]`` and holds the
+    position of the pair in the action space, or -1 for pairs outside of it.
+    The array is read-only.
+    """
+
+    table = np.full((len(ACTION), num_players), -1, dtype=np.intp)
+    for i, (act, tgt) in enumerate(action.action_space(num_players)):
+        table[ACTION_IDX[act], tgt] = i
+
+    table.flags.writeable = False
+    return table
+
+
+def fill_start_mask(
+    mask: np.ndarray,
+    coins: int,
+    others_alive: np.ndarray,
+    others_coins: np.ndarray,
+    self_idx: np.ndarray,
+    coup_idx: np.ndarray,
+    assassinate_idx: np.ndarray,
+    steal_idx: np.ndarray,
+):
+    """Write the start state actions into a zeroed action mask.
+
+    The other players' arrays and the targeted action indices are ordered by
+    target offset. Only plain integers and arrays are used, so the function
+    stays independent of the player and state objects.
+    """
+
+    if coins >= 7:
+        mask[coup_idx] = others_alive
+
+        if coins >= 10:
+            # must coup
+            return
+
+    if coins >= 3:
+        mask[assassinate_idx] = others_alive
+
+    mask[steal_idx] = others_alive & (others_coins > 0)
+    mask[self_idx] = 1
+
+
 class raw_env(AECEnv):
     """PettingZoo Coup game environment for RL training."""
 
@@ -35,25 +134,34 @@ class raw_env(AECEnv):
         num_players: int = 6,
         num_players_alive: int = 6,
         render_mode: str | None = "ansi",
+        record_history: bool = True,
     ):
         super().__init__()
 
         self.game_id = 0
 
+        # reseeded by reset when given a seed, otherwise carried across games
+        self.rng: np.random.Generator = np.random.default_rng()
+
         self.render_mode: str | None = render_mode
 
+        self.record_history: bool = record_history
+
         ### DECK ###
 
-        self.base_deck: Counter[CARD]
+        self.base_deck: np.ndarray = np.zeros(NUM_CARDS, dtype=np.int8)
 
         if not deck:
-            self.base_deck = Counter(dict.fromkeys(CARD, 3))
+            self.base_deck[:] = 3
         else:
-            self.base_deck = Counter(
-                {CARD(card_str): count for card_str, count in deck.items()}
-            )
+            for card_str, count in deck.items():
+                self.base_deck[CARD[card_str.upper()]] = count
+
+        self.deck: np.ndarray
 
-        self.deck: Counter[CARD]
+        # revealed and reserved cards of all players, kept up to date as
+        # cards leave play
+        self.out_of_play: np.ndarray
 
         self.dead_draw: bool = dead_draw
 
@@ -68,7 +176,7 @@ class raw_env(AECEnv):
                 f"{num_players_alive=} must be smaller than {num_players=}"
             )
 
-        max_players = self.base_deck.total() // 2 - 1
+        max_players = int(self.base_deck.sum()) // 2 - 1
 
         if num_players_alive > max_players:
             raise ValueError(
@@ -85,6 +193,19 @@ class raw_env(AECEnv):
 
         self.players: list[Player]
 
+        # card counts per player, indexed by [player, HAND/REVEALED/RESERVED, card]
+        self.cards: np.ndarray = np.zeros((num_players, 3, NUM_CARDS), dtype=np.int8)
+        # coins by seat and pass flags of the current turn by flag row and seat
+        self.coins: np.ndarray = np.zeros(num_players, dtype=np.int8)
+        self.passed: np.ndarray = np.zeros((3, num_players), dtype=bool)
+
+        self._seat = {agent: i for i, agent in enumerate(self.possible_agents)}
+
+        # seats in turn order starting from each seat, and the same order
+        # without the starting seat
+        self._from_perm = turn_order(num_players)
+        self._after_perm = self._from_perm[:, 1:]
+
         ### GAME STATE ###
 
         self.n_turn: int
@@ -101,32 +222,87 @@ class raw_env(AECEnv):
 
         obs_parts = state.observation_space(
             num_players=len(self.possible_agents),
-            max_card_count=max(self.base_deck.values()),
+            max_card_count=int(self.base_deck.max()),
         )
 
-        highs = []
         shape = 0
+        offset = {}
         for record in obs_parts:
+            offset[record["desc"]] = shape
             shape += record["size"]
-            highs += [record["max"]] * record["size"]
 
-        obs_space = spaces.Box(
-            low=0, high=np.array(highs), shape=(shape,), dtype=np.int8
+        self.obs_size: int = shape
+
+        # observation sections, from the first to the last of their parts
+        self._obs_coins = slice(
+            offset["Coins of each player"], offset["Unseen card totals"]
+        )
+        self._obs_unseen = slice(
+            offset["Unseen card totals"], offset["Player's cards by type"]
+        )
+        self._obs_own = slice(
+            offset["Player's cards by type"], offset["Card totals per player"]
+        )
+        self._obs_totals = slice(offset["Card totals per player"], offset["Action"])
+        self._obs_act = slice(offset["Action"], offset["Challenge passed"])
+        self._obs_challenge = slice(offset["Challenge passed"], offset["Block action"])
+        self._obs_block = slice(
+            offset["Block action"], offset["Block challenge passed"]
+        )
+        self._obs_block_challenge = slice(offset["Block challenge passed"], shape)
+
+        obs_space = copy.copy(
+            observation_box(len(self.possible_agents), int(self.base_deck.max()))
         )
 
         self.observation_spaces = dict.fromkeys(self.possible_agents, obs_space)
 
+        # past turn observations indexed by [seat, turn, observation index];
+        # grown along the turn axis as the game goes on
+        self.obs_history: np.ndarray
+        self.obs_history_len: int
+
         ### ACTION SPACE ###
 
-        self.acts: ActionSpace = action.action_space(
-            num_players=len(self.possible_agents)
+        self.act_to_idx: dict[ActionTarget, int] = dict(
+            action_index(len(self.possible_agents))
         )
 
-        self.act_to_idx = {act: i for i, act in enumerate(self.acts)}
+        self.acts: ActionSpace = list(self.act_to_idx)
+
+        # act_to_idx as a dense table indexed by [ACTION_IDX[action], target]
+        self._act_idx_table = action_index_table(len(self.possible_agents))
 
         act_space = spaces.Discrete(len(self.acts))
         self.action_spaces = dict.fromkeys(self.possible_agents, act_space)
 
+        ### ACTION MASK TABLES ###
+
+        table = self._act_idx_table
+
+        self._self_idx = table[
+            [ACTION_IDX[act] for act in ACTION if act.type == ACT.SELF], 0
+        ]
+
+        # action indices per target offset, from 1 to num_players - 1
+        self._coup_idx = table[ACTION_IDX[ACTION.COUP], 1:]
+        self._assassinate_idx = table[ACTION_IDX[ACTION.ASSASSINATE], 1:]
+        self._steal_idx = table[ACTION_IDX[ACTION.STEAL], 1:]
+
+        # LOSE action indices by card index
+        self._lose_idx = table[[ACTION_IDX[act] for act in state.LOSE_ACTION], 0]
+
+        self._challenge_base = self._mask_of(state.challenge_mask())
+
+        self._block_base = {
+            act: self._mask_of(state.block_mask(act)) for act in ACTION if act.block
+        }
+
+        # action mask of _mask_turn, shared by last and step and dropped by
+        # step, as pass states move their player in place
+        self._mask_buf = np.zeros(len(self.acts), dtype=np.int8)
+        self._mask_turn: state.Any | None = None
+
     @property
     def agent_selection(self) -> AgentID:
         """Return the current agent whose turn it is."""
@@ -148,8 +324,8 @@ class raw_env(AECEnv):
                 "Options passed to reset method, but not used: options=%s", options
             )
 
-        # reset numpy random seed
-        np.random.seed(seed)
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
 
         self.game_id += 1
         logger.debug(
@@ -160,21 +336,40 @@ class raw_env(AECEnv):
         )
 
         self.deck = self.base_deck.copy()
-        logger.debug("Initial deck: %s", {str(k): v for k, v in self.deck.items()})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Initial deck: %s", {str(card): int(self.deck[card]) for card in CARDS}
+            )
+
+        self.cards.fill(0)
+        self.coins.fill(2)
+        self.passed.fill(False)
+        self.out_of_play = np.zeros(NUM_CARDS, dtype=np.int8)
 
         shuffled_agents = self.possible_agents.copy()
-        np.random.shuffle(shuffled_agents)
+        self.rng.shuffle(shuffled_agents)
 
         self.agents = sorted(shuffled_agents[: self.num_players_alive])
 
         logger.debug("Active agents: %s", self.agents)
 
         self.players = [
-            Player(id=agent, _deck=self.deck) for agent in self.possible_agents
+            Player(
+                id=agent,
+                idx=i,
+                _deck=self.deck,
+                _out_of_play=self.out_of_play,
+                _rng=self.rng,
+                cards=self.cards[i, HAND],
+                revealed=self.cards[i, REVEALED],
+                _coins=self.coins,
+                _passed=self.passed,
+            )
+            for i, agent in enumerate(self.possible_agents)
         ]
 
         for i, player in enumerate(self.players):
-            player.next = self.players[(i + 1) % len(self.players)]
+            player.seat(tuple(self.players[seat] for seat in self._from_perm[i]))
 
             if player.id in self.agents:
                 logger.debug("Initializing alive %s", player.id)
@@ -185,10 +380,12 @@ class raw_env(AECEnv):
             elif self.dead_draw:
                 logger.debug("Dead draw for %s", player.id)
 
-                draw(self.deck)
-                draw(self.deck)
+                for _ in range(2):
+                    card = draw(self.deck, self.rng)
+                    self.cards[i, RESERVED, card] += 1
+                    self.out_of_play[card] += 1
 
-        agent_idx = np.random.randint(0, len(self.agents))
+        agent_idx = self.rng.integers(len(self.agents))
         agent = self.agents[agent_idx]
 
         self.n_turn = 1
@@ -198,53 +395,217 @@ class raw_env(AECEnv):
         self.rewards = dict.fromkeys(self.agents, 0.0)
         self._cumulative_rewards = dict.fromkeys(self.agents, 0.0)
 
-        self.infos = {agent: {"observation_history": []} for agent in self.agents}
+        self.obs_history_len = 0
+
+        if self.record_history:
+            self.obs_history = np.zeros(
+                (len(self.possible_agents), 32, self.obs_size), dtype=np.int8
+            )
+            self.infos = {
+                agent: {"observation_history": self._history_view(agent, 0)}
+                for agent in self.agents
+            }
+        else:
+            self.infos = {agent: {} for agent in self.agents}
         self.truncations = dict.fromkeys(self.agents, False)
         self.terminations = dict.fromkeys(self.agents, False)
 
     def find_player(self, agent: AgentID) -> Player:
         """Retrieve player object by agent ID."""
 
-        for player in self.players:
-            if player.id == agent:
-                return player
-        raise ValueError(f"{agent} not found")
+        seat = self._seat.get(agent)
+        if seat is None:
+            raise ValueError(f"{agent} not found")
+        return self.players[seat]
+
+    def observe(self, agent: AgentID, out: np.ndarray | None = None) -> np.ndarray:
+        """Generate observation for the given agent.
+
+        The observation is written into ``out`` when given, otherwise into a
+        new array.
+        """
+
+        seat = self._seat[agent]
+        player = self.players[seat]
+
+        # cards in the deck or in other players' hands
+        unseen = self.base_deck - self.out_of_play - player.cards
+
+        perm = self._from_perm[seat]
+
+        if out is None:
+            obs = np.zeros(self.obs_size, dtype=np.int8)
+        else:
+            obs = out
+            obs.fill(0)
 
-    def observe(self, agent: AgentID) -> np.ndarray:
-        """Generate observation for the given agent."""
+        obs[self._obs_coins] = self.coins[perm]
+        obs[self._obs_unseen] = unseen
+        obs[self._obs_own] = player.cards
+        obs[self._obs_totals] = self.cards[perm, HAND].sum(axis=1)
+
+        self._observe_turn(player, obs)
+
+        return obs
+
+    def observe_all(self, agents: list[AgentID] | None = None) -> np.ndarray:
+        """Generate the observations of several agents at once.
+
+        Defaults to all agents in the game. Returns an array indexed by
+        ``[position in agents, observation index]``. The card and coin sections
+        are gathered for all observers with one set of array operations.
+        """
+
+        if agents is None:
+            agents = self.agents
+
+        seats = np.fromiter(
+            (self._seat[agent] for agent in agents), dtype=np.intp, count=len(agents)
+        )
+        perms = self._from_perm[seats]
+
+        hands = self.cards[:, HAND]
+        obs = np.zeros((len(agents), self.obs_size), dtype=np.int8)
+
+        obs[:, self._obs_coins] = self.coins[perms]
+        obs[:, self._obs_unseen] = self.base_deck - self.out_of_play - hands[seats]
+        obs[:, self._obs_own] = hands[seats]
+        obs[:, self._obs_totals] = hands.sum(axis=1)[perms]
+
+        for row, seat in zip(obs, seats, strict=True):
+            self._observe_turn(self.players[seat], row)
+
+        return obs
+
+    def _observe_turn(self, player: Player, obs: np.ndarray):
+        """Write the turn sections of a player's observation."""
 
         turn = self.turn
 
-        player = self.find_player(agent)
+        # sections of turn info that did not happen stay zero
+        state.observe_act(getattr(turn, "act", None), player, obs[self._obs_act])
+        state.observe_challenge(
+            getattr(turn, "challenge", None), player, obs[self._obs_challenge]
+        )
+        state.observe_block(getattr(turn, "block", None), player, obs[self._obs_block])
+        state.observe_challenge(
+            getattr(turn, "block_challenge", None),
+            player,
+            obs[self._obs_block_challenge],
+        )
+
+    def save_observations(self):
+        """Append the current observation of every agent to the history."""
+
+        n = self.obs_history_len
 
-        unseen = self.deck.copy()
-        for _, nxt in player.enum(skip_self=True):
-            for card in nxt.cards.elements():
-                unseen[card] += 1
+        if n == self.obs_history.shape[1]:
+            self.obs_history = np.concatenate(
+                (self.obs_history, np.zeros_like(self.obs_history)), axis=1
+            )
 
-        obs = [nxt.coins for _, nxt in player.enum()]
-        obs += [unseen[card] for card in CARD]
-        obs += [player.cards[card] for card in CARD]
-        obs += [nxt.cards.total() for _, nxt in player.enum()]
-        obs += state.observe_act(getattr(turn, "act", None), player)
-        obs += state.observe_challenge(getattr(turn, "challenge", None), player)
-        obs += state.observe_block(getattr(turn, "block", None), player)
-        obs += state.observe_challenge(getattr(turn, "block_challenge", None), player)
+        seats = [self._seat[agent] for agent in self.agents]
+        self.obs_history[seats, n] = self.observe_all()
 
-        return np.array(obs, dtype=np.int8)
+        self.obs_history_len = n + 1
 
-    def get_action_mask(self) -> np.ndarray:
-        """Generate valid action mask for the current player."""
+        for agent in self.agents:
+            self.infos[agent]["observation_history"] = self._history_view(agent, n + 1)
 
-        action_mask = [False] * len(self.acts)
+    def _history_view(self, agent: AgentID, length: int) -> np.ndarray:
+        """Return a read-only view of the first turns of an agent's history.
 
-        actions = self.turn.action_mask()
+        The view shares the env buffer, so it is only valid until the next step,
+        which may grow the buffer into a new array.
+        """
+
+        history = self.obs_history[self._seat[agent], :length]
+        history.flags.writeable = False
+        return history
+
+    def _mask_of(self, actions: ActionMask) -> np.ndarray:
+        """Convert a list of valid actions into an action mask."""
+        mask = np.zeros(len(self.acts), dtype=np.int8)
 
         for act, tgt in actions:
-            idx = self.act_to_idx[(act, tgt)]
-            action_mask[idx] = True
+            mask[self._act_idx_table[act.idx, tgt]] = 1
+
+        return mask
+
+    def _start_mask(self, turn: state.Start, mask: np.ndarray):
+        """Fill the action mask of the start state."""
+        player = turn.player
+        others = self._after_perm[player.idx]
+
+        fill_start_mask(
+            mask,
+            player.coins,
+            self.cards[others, HAND].any(axis=1),
+            self.coins[others],
+            self._self_idx,
+            self._coup_idx,
+            self._assassinate_idx,
+            self._steal_idx,
+        )
 
-        return np.array(action_mask, dtype=np.int8)
+    def _challenge_mask(
+        self, _turn: state.Challenge | state.BlockChallenge, mask: np.ndarray
+    ):
+        """Fill the action mask of the challenge states."""
+        mask[:] = self._challenge_base
+
+    def _block_mask(
+        self, turn: state.ForeignAidBlock | state.TargetBlock, mask: np.ndarray
+    ):
+        """Fill the action mask of the block states."""
+        mask[:] = self._block_base[turn.act.action]
+
+    def _lose_mask(self, turn: state.Any, mask: np.ndarray):
+        """Fill the action mask of states where a card is lost or put back."""
+        mask[self._lose_idx] = turn.player.cards > 0
+
+    def _empty_mask(self, _turn: state.EndTurn | state.GameOver, mask: np.ndarray):
+        """Leave the action mask of states without actions empty."""
+
+    _MASK_DISPATCH = {
+        state.Start: _start_mask,
+        state.Challenge: _challenge_mask,
+        state.BlockChallenge: _challenge_mask,
+        state.ForeignAidBlock: _block_mask,
+        state.TargetBlock: _block_mask,
+        state.ChallengeResolve: _lose_mask,
+        state.BlockChallengeResolve: _lose_mask,
+        state.ActionResolve: _lose_mask,
+        state.ExchangeResolve: _lose_mask,
+        state.ExchangeTwoResolve: _lose_mask,
+        state.EndTurn: _empty_mask,
+        state.GameOver: _empty_mask,
+    }
+
+    def get_action_mask(self, out: np.ndarray | None = None) -> np.ndarray:
+        """Generate valid action mask for the current player.
+
+        The mask is written into ``out`` when given, otherwise into a new array.
+        """
+
+        mask = np.zeros(len(self.acts), dtype=np.int8) if out is None else out
+        mask.fill(0)
+
+        turn = self.turn
+        self._MASK_DISPATCH[type(turn)](self, turn, mask)
+        return mask
+
+    def _turn_mask(self) -> np.ndarray:
+        """Return the action mask of the current turn, built once per turn.
+
+        The returned buffer is reused and must not be kept by callers.
+        """
+
+        if self._mask_turn is not self.turn:
+            self.get_action_mask(out=self._mask_buf)
+            self._mask_turn = self.turn
+
+        return self._mask_buf
 
     def last(self, observe: bool = True):
         """Return observation, reward, and game state for the last player to act."""
@@ -257,7 +618,7 @@ class raw_env(AECEnv):
 
         truncation = self.truncations[player.id]
 
-        self.infos[player.id]["action_mask"] = self.get_action_mask()
+        self.infos[player.id]["action_mask"] = self._turn_mask().copy()
 
         info = self.infos[player.id]
 
@@ -298,7 +659,7 @@ class raw_env(AECEnv):
             turn = self.turn
             player = turn.player
 
-            action_mask = self.get_action_mask()
+            action_mask = self._turn_mask()
 
             if not action_mask[action]:
                 logger.error(
@@ -311,80 +672,77 @@ class raw_env(AECEnv):
 
             action_obj, tgt = self.acts[action]
 
-            target = player
-            while target and tgt:
-                target = target.next
-                tgt -= 1
+            target = player.ring[tgt]
 
-            if target is None or not target.alive:
+            if not target.alive:
                 raise RuntimeError(f"Invalid target for action {action_obj.name}")
 
-            logger.debug(
-                "Step: turn_type=%s, player=%s, action=%s, target=%s",
-                type(turn).__name__,
-                player.id,
-                action_obj.name,
-                target.id,
-            )
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            if debug:
+                logger.debug(
+                    "Step: turn_type=%s, player=%s, action=%s, target=%s",
+                    type(turn).__name__,
+                    player.id,
+                    action_obj.name,
+                    target.id,
+                )
 
             self.turn = self.turn.step(action_obj, target)
-            logger.debug("New turn state: %s", type(self.turn).__name__)
+            self._mask_turn = None
+
+            if debug:
+                logger.debug("New turn state: %s", type(self.turn).__name__)
 
         if type(self.turn) is state.EndTurn:
-            # get longest observation_history
-            if self.agents:
-                dct = max(
-                    (x["observation_history"] for x in self.infos.values()),
-                    key=lambda x: len(x),
-                )
+            if (
+                self.record_history
+                and self.agents
+                and self.obs_history_len < self.n_turn
+            ):
+                logger.debug("Saving observations for all players")
+                self.save_observations()
 
-                if len(dct) < self.n_turn:
-                    logger.debug("Saving observations for all players")
-                    for player in self.players:
-                        if player.id not in self.agents:
-                            continue
-                        obs = self.observe(player.id)
-                        self.infos[player.id]["observation_history"].append(obs)
+            self.passed.fill(False)
 
             for player in self.players:
-                player.challenge_passed = False
-                player.block_passed = False
-                player.block_challenge_passed = False
-
                 if not player.alive and player.id in self.agents:
                     logger.debug("%s died", player.id)
                     self.terminations[player.id] = True
-                    self.turn = replace(self.turn, _player=player)
+                    self.turn._player = player
                     return
 
             if len(self.agents) == 1:
                 winner_id = self.agents[0]
                 winner = self.find_player(winner_id)
-                logger.debug(
-                    "%s won with %d cards\n",
-                    winner.id,
-                    winner.cards.total(),
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "%s won with %d cards\n", winner.id, winner.cards.sum()
+                    )
                 self.rewards[winner.id] = 1.0
                 self._cumulative_rewards[winner.id] = 1.0
                 self.terminations[winner.id] = True
-                self.turn = replace(self.turn, _player=winner)
+                self.turn._player = winner
                 return
 
             if self.agents:
-                logger.debug(
-                    "Turn %d completed, moving to %s\n",
-                    self.n_turn,
-                    self.turn.act.actor.next_alive.id,
-                )
+                nxt = self.turn.act.actor.next_alive
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Turn %d completed, moving to %s\n", self.n_turn, nxt.id
+                    )
                 self.n_turn += 1
-                self.turn = state.Start(player=self.turn.act.actor.next_alive)
+                self.turn = state.Start(player=nxt)
                 return
 
             return
 
     def render(self) -> str | None:
-        """Render the current game state as a string."""
+        """Render the current game state as a string.
+
+        Hands are listed by card type in CARD order, not in the order the
+        cards were drawn, which the card count arrays do not record.
+        """
 
         if self.render_mode is None:
             logger.warning(
@@ -418,7 +776,7 @@ class raw_env(AECEnv):
         players = [
             {
                 "id": str(player.id),
-                "cards": " ".join(str(card)[:3] for card in player.cards.elements()),
+                "cards": " ".join(np.repeat(CARD_SHORT_NAMES, player.cards).tolist()),
                 "coins": f"{player.coins}$",
             }
             for player in self.players
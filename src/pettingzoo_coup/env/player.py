@@ -1,11 +1,12 @@
 """Player representation and management."""
 
 import logging
-from collections import Counter
-from collections.abc import Iterator
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import NewType
 
+import numpy as np
+
 from pettingzoo_coup.env.card import CARD, draw
 
 logger = logging.getLogger(__name__)
@@ -13,91 +14,155 @@ logger = logging.getLogger(__name__)
 
 AgentID = NewType("AgentID", str)
 
+# Rows of the per-player card state array: cards in hand, cards lost and
+# revealed, and cards drawn out of play for non-participating players.
+HAND, REVEALED, RESERVED = range(3)
+
+# Rows of the per-player pass flag array of the current turn.
+CHALLENGE_PASSED, BLOCK_PASSED, BLOCK_CHALLENGE_PASSED = range(3)
+
 
 class PlayerError(Exception):
     """Raised when an invalid operation is attempted on a player."""
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class Player:
     """Represents a single player in the game with cards and coins."""
 
     id: AgentID
-    _deck: Counter[CARD]
-    coins: int = 2
-    cards: Counter[CARD] = field(default_factory=Counter)
+    # seat, indexing the env player list and card state array
+    idx: int
+    _deck: np.ndarray
+    _out_of_play: np.ndarray
+    _rng: np.random.Generator
+    cards: np.ndarray
+    revealed: np.ndarray
+
+    # env arrays of coins by seat and pass flags by row and seat
+    _coins: np.ndarray = field(repr=False)
+    _passed: np.ndarray = field(repr=False)
+
+    # all players in turn order starting from this one, set once seated
+    ring: tuple["Player", ...] = field(default=(), repr=False)
+    # seats of the ring as an index array, so per-seat env arrays are gathered
+    # in this player's order with one fancy index
+    order: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.intp), repr=False
+    )
+
+    # ring with relative indices, with and without this player, returned by
+    # enum as is when dead players are kept and filtered lazily otherwise,
+    # so no enumerate or slice is built per call
+    _enum_all: tuple[tuple[int, "Player"], ...] = field(default=(), repr=False)
+    _enum_others: tuple[tuple[int, "Player"], ...] = field(default=(), repr=False)
+
+    def seat(self, ring: tuple["Player", ...]):
+        """Set the players in turn order starting from this one."""
+        self.ring = ring
+        self.order = np.fromiter(
+            (player.idx for player in ring), dtype=np.intp, count=len(ring)
+        )
+        self._enum_all = tuple(enumerate(ring))
+        self._enum_others = self._enum_all[1:]
+
+    @property
+    def coins(self) -> int:
+        """Number of coins held by the player."""
+        return int(self._coins[self.idx])
+
+    @coins.setter
+    def coins(self, value: int):
+        self._coins[self.idx] = value
+
+    @property
+    def challenge_passed(self) -> bool:
+        """Whether the player passed on challenging the action this turn."""
+        return bool(self._passed[CHALLENGE_PASSED, self.idx])
+
+    @challenge_passed.setter
+    def challenge_passed(self, value: bool):
+        self._passed[CHALLENGE_PASSED, self.idx] = value
+
+    @property
+    def block_passed(self) -> bool:
+        """Whether the player passed on blocking the action this turn."""
+        return bool(self._passed[BLOCK_PASSED, self.idx])
 
-    block_passed: bool = False
-    challenge_passed: bool = False
-    block_challenge_passed: bool = False
+    @block_passed.setter
+    def block_passed(self, value: bool):
+        self._passed[BLOCK_PASSED, self.idx] = value
 
-    next: "Player | None" = None
+    @property
+    def block_challenge_passed(self) -> bool:
+        """Whether the player passed on challenging the block this turn."""
+        return bool(self._passed[BLOCK_CHALLENGE_PASSED, self.idx])
+
+    @block_challenge_passed.setter
+    def block_challenge_passed(self, value: bool):
+        self._passed[BLOCK_CHALLENGE_PASSED, self.idx] = value
+
+    def ring_coins(self) -> np.ndarray:
+        """Return the coins of all players in this player's ring order."""
+        return self._coins[self.order]
+
+    def ring_passed(self, row: int) -> np.ndarray:
+        """Return a row of pass flags of all players in this player's ring order."""
+        return self._passed[row, self.order]
+
+    def relative_idx(self, other: "Player") -> int:
+        """Return the position of another player in this player's ring."""
+        return (other.idx - self.idx) % len(self.ring)
 
     @property
     def alive(self) -> bool:
         """Check if player is still in the game."""
-        return self.cards.total() > 0
+        return bool(self.cards.any())
 
     @property
     def next_alive(self) -> "Player":
         """Return the next alive player in turn order."""
-        player = self.next
-        while player is not None and player != self:
+        for player in self.ring[1:]:
             if player.alive:
                 return player
-            player = player.next
         raise PlayerError("No other alive players found")
 
     def draw(self):
         """Draw a card from the deck."""
-        card = draw(self._deck)
+        card = draw(self._deck, self._rng)
         self.cards[card] += 1
-        logger.debug(
-            "%s drew %s; total cards=%d", self.id, str(card), self.cards.total()
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s drew %s; total cards=%d", self.id, card, self.cards.sum())
 
     def putback(self, card: CARD):
         """Return a card to the deck."""
-        assert card in self.cards
+        assert self.cards[card]
 
         self.cards[card] -= 1
-        if not self.cards[card]:
-            del self.cards[card]
-
         self._deck[card] += 1
 
-        logger.debug(
-            "%s put back %s; deck count=%d", self.id, str(card), self._deck[card]
-        )
+        logger.debug("%s put back %s; deck count=%d", self.id, card, self._deck[card])
 
     def lose(self, card: CARD):
-        """Remove a card from player's hand permanently."""
-        assert card in self.cards
+        """Reveal a card from player's hand, removing it from play permanently."""
+        assert self.cards[card]
 
         self.cards[card] -= 1
-        if not self.cards[card]:
-            del self.cards[card]
-
-        logger.debug(
-            "%s loses %s; total cards=%d",
-            self.id,
-            str(card),
-            self.cards.total(),
-        )
+        self.revealed[card] += 1
+        self._out_of_play[card] += 1
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s loses %s; total cards=%d", self.id, card, self.cards.sum())
 
     def enum(
         self,
         skip_dead: bool = False,
         skip_self: bool = False,
-    ) -> Iterator[tuple[int, "Player"]]:
+    ) -> Iterable[tuple[int, "Player"]]:
         """Enumerate players in turn order with their relative indices."""
-        if not skip_self and (not skip_dead or self.alive):
-            yield 0, self
-
-        i = 1
-        player = self.next
-        while player is not None and player != self:
-            if not skip_dead or player.alive:
-                yield i, player
-            i += 1
-            player = player.next
+        players = self._enum_others if skip_self else self._enum_all
+
+        if not skip_dead:
+            return players
+
+        return ((i, player) for i, player in players if player.alive)
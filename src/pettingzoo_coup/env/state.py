@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
-from dataclasses import dataclass, replace
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Literal
 
+import numpy as np
+
 from pettingzoo_coup.env.action import (
     ACT,
     ACTION,
-    BLOCK_ACTION,
-    START_ACTION,
+    BLOCKED_BY,
+    LEN_BLOCK_ACTION,
+    LEN_START_ACTION,
     Action,
     ActionMask,
 )
-from pettingzoo_coup.env.card import CARD
-from pettingzoo_coup.env.player import Player
+from pettingzoo_coup.env.card import CARDS, NUM_CARDS
+from pettingzoo_coup.env.player import (
+    BLOCK_CHALLENGE_PASSED,
+    BLOCK_PASSED,
+    CHALLENGE_PASSED,
+    Player,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,40 +36,51 @@ class InvalidState(Exception):
     """Raised when an invalid state is reached for debugging purposes."""
 
 
-def lose_card_mask(player: Player) -> ActionMask:
-    """Generate valid card loss actions for a player."""
-    actions = []
+LOSE_ACTION: tuple[Action, ...] = tuple(
+    next(action for action in ACTION if action.card == card and action.type == ACT.LOSE)
+    for card in CARDS
+)
 
-    for action in ACTION:
-        if action.type == ACT.LOSE and player.cards[action.card]:
-            actions.append((action, 0))
+EMPTY_MASK: ActionMask = ()
 
-    return actions
+SELF_MASK: ActionMask = tuple(
+    (action, 0) for action in ACTION if action.type == ACT.SELF
+)
 
+CHALLENGE_MASK: ActionMask = tuple(
+    (action, 0) for action in ACTION if action.type == ACT.CHALLENGE
+)
 
-def block_mask(act: Action) -> ActionMask:
-    """Generate valid block actions against the given action."""
-    actions = []
+BLOCK_MASK: dict[Action, ActionMask] = {
+    act: tuple((action, 0) for action in BLOCKED_BY[act]) for act in ACTION
+}
 
-    for action in ACTION:
-        if action.name in act.block:
-            actions.append((action, 0))
+# lose actions for every combination of card types in hand, keyed by the bytes
+# of the hand as a bool array
+LOSE_MASK: dict[bytes, ActionMask] = {
+    np.array(held, dtype=bool).tobytes(): tuple(
+        (action, 0) for action, has in zip(LOSE_ACTION, held, strict=True) if has
+    )
+    for held in itertools.product((False, True), repeat=NUM_CARDS)
+}
 
-    return actions
 
+def lose_card_mask(player: Player) -> ActionMask:
+    """Generate valid card loss actions for a player."""
+    return LOSE_MASK[(player.cards > 0).tobytes()]
 
-def challenge_mask() -> ActionMask:
-    """Generate valid challenge actions."""
-    actions = []
 
-    for action in ACTION:
-        if action.type == ACT.CHALLENGE:
-            actions.append((action, 0))
+def block_mask(act: Action) -> ActionMask:
+    """Generate valid block actions against the given action."""
+    return BLOCK_MASK[act]
 
-    return actions
 
+def challenge_mask() -> ActionMask:
+    """Generate valid challenge actions."""
+    return CHALLENGE_MASK
 
-@dataclass(frozen=True, slots=True)
+
+@dataclass(slots=True)
 class ActInfo:
     """Information about an action being performed by a player."""
 
@@ -66,29 +89,28 @@ class ActInfo:
     target: Player
 
 
-def observe_act(act: ActInfo | None, player: Player) -> list[bool]:
-    """Generate observation vector for an action."""
+def observe_act(act: ActInfo | None, player: Player, out: np.ndarray):
+    """Write the observation vector of an action into a zeroed array."""
 
-    if act:
-        vec = [act.action == action for action in START_ACTION]  # idx
-        vec += [act.actor == nxt for _, nxt in player.enum()]  # actor
-        vec += [act.target == nxt for _, nxt in player.enum()]  # target
+    if not act:
+        return
 
-    else:
-        vec = [False for _ in START_ACTION]
-        vec += [False for _ in player.enum()]
-        vec += [False for _ in player.enum()]
+    n = len(player.ring)
+    offset = LEN_START_ACTION
 
-    return vec
+    out[act.action.start_idx] = 1  # idx
+    out[offset + player.relative_idx(act.actor)] = 1  # actor
+    out[offset + n + player.relative_idx(act.target)] = 1  # target
 
 
 def resolve_steal(act: ActInfo):
     """Execute a steal action, transferring coins between players."""
 
-    amount = min(2, act.target.coins)
+    held = act.target.coins
+    amount = 2 if held > 2 else held
 
     act.actor.coins += amount
-    act.target.coins -= amount
+    act.target.coins = held - amount
 
     logger.debug(
         "Steal resolved: %s steals %d coins from target=%s",
@@ -99,7 +121,7 @@ def resolve_steal(act: ActInfo):
     return
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class ChallengeInfo:
     """Information about a challenge to an action or block."""
 
@@ -107,36 +129,35 @@ class ChallengeInfo:
     challenger: Player
     loser: Player
 
-    @property
-    def failed(self) -> bool:
-        return self.loser == self.challenger
+    # whether the challenger lost the challenge, set once on creation
+    failed: bool = field(init=False)
 
+    def __post_init__(self):
+        self.failed = self.loser is self.challenger
 
-def observe_challenge(chl: ChallengeInfo | None, player: Player) -> list[bool]:
-    """Generate observation vector for a challenge."""
 
-    if chl:
-        if chl.type == "action":
-            vec = [nxt.challenge_passed for _, nxt in player.enum()]
+def observe_challenge(chl: ChallengeInfo | None, player: Player, out: np.ndarray):
+    """Write the observation vector of a challenge into a zeroed array."""
 
-        elif chl.type == "block":
-            vec = [nxt.block_challenge_passed for _, nxt in player.enum()]
+    if not chl:
+        return
 
-        else:
-            raise InvalidState("Invalid challenge type")
+    n = len(player.ring)
+
+    if chl.type == "action":
+        out[:n] = player.ring_passed(CHALLENGE_PASSED)
 
-        vec += [chl.challenger == nxt for _, nxt in player.enum()]
-        vec += [chl.loser == nxt for _, nxt in player.enum()]
+    elif chl.type == "block":
+        out[:n] = player.ring_passed(BLOCK_CHALLENGE_PASSED)
 
     else:
-        vec = [False for _ in player.enum()]
-        vec += [False for _ in player.enum()]
-        vec += [False for _ in player.enum()]
+        raise InvalidState("Invalid challenge type")
 
-    return vec
+    out[n + player.relative_idx(chl.challenger)] = 1
+    out[2 * n + player.relative_idx(chl.loser)] = 1
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class BlockInfo:
     """Information about a block attempt against an action."""
 
@@ -144,20 +165,18 @@ class BlockInfo:
     action: Action
 
 
-def observe_block(blk: BlockInfo | None, player: Player) -> list[bool]:
-    """Generate observation vector for a block."""
+def observe_block(blk: BlockInfo | None, player: Player, out: np.ndarray):
+    """Write the observation vector of a block into a zeroed array."""
 
-    if blk:
-        vec = [blk.action == action for action in BLOCK_ACTION]
-        vec += [nxt.block_passed for _, nxt in player.enum()]
-        vec += [blk.blocker == nxt for _, nxt in player.enum()]
+    if not blk:
+        return
 
-    else:
-        vec = [False for _ in range(len(BLOCK_ACTION))]
-        vec += [False for _ in player.enum()]
-        vec += [False for _ in player.enum()]
+    n = len(player.ring)
+    offset = LEN_BLOCK_ACTION
 
-    return vec
+    out[blk.action.block_idx] = 1
+    out[offset : offset + n] = player.ring_passed(BLOCK_PASSED)
+    out[offset + n + player.relative_idx(blk.blocker)] = 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -167,27 +186,29 @@ class Start:
     player: Player
 
     def action_mask(self) -> ActionMask:
-        actions = []
-
         player = self.player
+        coins = player.coins
+
+        # relative indices of the alive opponents, found once per mask
+        targets = [i for i, _ in player.enum(skip_dead=True, skip_self=True)]
+
+        actions = []
 
-        if player.coins >= 7:
-            for i, _ in player.enum(skip_dead=True, skip_self=True):
-                actions.append((ACTION.COUP, i))
+        if coins >= 7:
+            actions.extend((ACTION.COUP, i) for i in targets)
 
-            if player.coins >= 10:
+            if coins >= 10:
                 # must coup
                 return actions
 
-        for i, other in player.enum(skip_dead=True, skip_self=True):
-            if player.coins >= 3:
+        ring_coins = player.ring_coins()
+        for i in targets:
+            if coins >= 3:
                 actions.append((ACTION.ASSASSINATE, i))
-            if other.coins > 0:
+            if ring_coins[i] > 0:
                 actions.append((ACTION.STEAL, i))
 
-        for action in ACTION:
-            if action.type == ACT.SELF:
-                actions.append((action, 0))
+        actions.extend(SELF_MASK)
 
         return actions
 
@@ -201,53 +222,72 @@ class Start:
             target.id,
         )
 
-        if act.action == ACTION.INCOME:
-            act.actor.coins += 1
+        handler = self._STEP.get(action)
+        if handler is None:
+            raise InvalidState("Action not handled for this state")
 
-            logger.debug(
-                "Income: %s gains 1 coin, now has %d",
-                act.actor.id,
-                act.actor.coins,
-            )
+        return handler(self, act)
+
+    def _income(self, act: ActInfo) -> EndTurn:
+        act.actor.coins += 1
 
-            return EndTurn(act=act)
+        logger.debug(
+            "Income: %s gains 1 coin, now has %d",
+            act.actor.id,
+            act.actor.coins,
+        )
 
-        if act.action == ACTION.FOREIGN_AID:
-            logger.debug("Foreign Aid: moving to block phase")
+        return EndTurn(act=act)
 
-            return ForeignAidBlock(player=self.player.next_alive, act=act)
+    def _foreign_aid(self, act: ActInfo) -> ForeignAidBlock:
+        logger.debug("Foreign Aid: moving to block phase")
 
-        if act.action == ACTION.COUP:
-            act.actor.coins -= 7
+        return ForeignAidBlock(player=self.player.next_alive, act=act)
 
-            logger.debug(
-                "Coup: %s pays 7 coins, now has %d",
-                act.actor.id,
-                act.actor.coins,
-            )
+    def _coup(self, act: ActInfo) -> ActionResolve:
+        act.actor.coins -= 7
 
-            return ActionResolve(player=act.target, act=act)
+        logger.debug(
+            "Coup: %s pays 7 coins, now has %d",
+            act.actor.id,
+            act.actor.coins,
+        )
 
-        if act.action == ACTION.ASSASSINATE:
-            act.actor.coins -= 3
+        return ActionResolve(player=act.target, act=act)
 
-            logger.debug(
-                "Assassinate: %s pays 3 coins, now has %d",
-                act.actor.id,
-                act.actor.coins,
-            )
+    def _assassinate(self, act: ActInfo) -> Challenge:
+        act.actor.coins -= 3
+
+        logger.debug(
+            "Assassinate: %s pays 3 coins, now has %d",
+            act.actor.id,
+            act.actor.coins,
+        )
 
-        if act.action.card:
-            logger.debug("Card-based action: moving to challenge phase")
+        return self._card_action(act)
 
-            return Challenge(player=self.player.next_alive, act=act)
+    def _card_action(self, act: ActInfo) -> Challenge:
+        logger.debug("Card-based action: moving to challenge phase")
 
-        raise InvalidState("Action not handled for this state")
+        return Challenge(player=self.player.next_alive, act=act)
 
+    _STEP = {
+        ACTION.INCOME: _income,
+        ACTION.FOREIGN_AID: _foreign_aid,
+        ACTION.COUP: _coup,
+        ACTION.ASSASSINATE: _assassinate,
+        ACTION.EXCHANGE: _card_action,
+        ACTION.STEAL: _card_action,
+        ACTION.TAX: _card_action,
+    }
 
-@dataclass(frozen=True, slots=True)
+
+@dataclass(slots=True)
 class Challenge:
-    """State where players can challenge an action."""
+    """State where players can challenge an action.
+
+    Not frozen: passes move ``player`` to the next alive player in place.
+    """
 
     player: Player
     act: ActInfo
@@ -256,69 +296,85 @@ class Challenge:
         return challenge_mask()
 
     def step(self, action: Action, *_) -> Any:
+        logger.debug(
+            "Challenge state: player=%s action=%s", self.player.id, action.name
+        )
+
+        handler = self._STEP.get(action)
+        if handler is None:
+            raise InvalidState("Action not handled for this state")
+
+        return handler(self)
+
+    def _pass(self) -> Any:
         player = self.player
-        logger.debug("Challenge state: player=%s action=%s", player.id, action.name)
 
-        if action == ACTION.CHALLENGE_PASS:
-            player.challenge_passed = True
-            logger.debug("Challenge passed by %s", player.id)
+        player.challenge_passed = True
+        logger.debug("Challenge passed by %s", player.id)
 
-            if self.player.next_alive == self.act.actor:
-                if self.act.action == ACTION.EXCHANGE:
-                    logger.debug("Exchange action proceeding")
-                    self.act.actor.draw()
-                    self.act.actor.draw()
-                    return ExchangeResolve(player=self.act.actor, act=self.act)
+        if player.next_alive != self.act.actor:
+            logger.debug("Moving challenge to next player")
 
-                if self.act.action == ACTION.TAX:
-                    self.act.actor.coins += 3
-                    logger.debug(
-                        "Tax action: %s gains 3 coins, now has %d",
-                        self.act.actor.id,
-                        self.act.actor.coins,
-                    )
-                    return EndTurn(act=self.act)
+            self.player = player.next_alive
+            return self
 
-                if self.act.action.block:
-                    logger.debug("Moving to target block phase")
-                    return TargetBlock(player=self.act.target, act=self.act)
+        if self.act.action == ACTION.EXCHANGE:
+            logger.debug("Exchange action proceeding")
+            self.act.actor.draw()
+            self.act.actor.draw()
+            return ExchangeResolve(player=self.act.actor, act=self.act)
 
-            else:
-                logger.debug("Moving challenge to next player")
+        if self.act.action == ACTION.TAX:
+            self.act.actor.coins += 3
+            logger.debug(
+                "Tax action: %s gains 3 coins, now has %d",
+                self.act.actor.id,
+                self.act.actor.coins,
+            )
+            return EndTurn.from_state(self)
 
-                return replace(self, player=self.player.next_alive)
+        if self.act.action.block:
+            logger.debug("Moving to target block phase")
+            return TargetBlock(player=self.act.target, act=self.act)
 
-        if action == ACTION.CHALLENGE_CALL:
-            logger.debug("Challenge called by %s", player.id)
+        raise InvalidState("Action not handled for this state")
 
-            actor = self.act.actor
-            card = self.act.action.card
+    def _call(self) -> ChallengeResolve:
+        player = self.player
 
-            assert card
+        logger.debug("Challenge called by %s", player.id)
 
-            if actor.cards[card]:
-                loser = player
+        actor = self.act.actor
+        card = self.act.action.card
 
-                logger.debug("Challenge failed: actor has the card, challenger loses")
-                actor.putback(card)
-                actor.draw()
-            else:
-                loser = actor
-                logger.debug(
-                    "Challenge succeeded: actor doesn't have the card, actor loses"
-                )
+        assert card is not None
 
-            chl = ChallengeInfo(type="action", challenger=self.player, loser=loser)
+        if actor.cards[card]:
+            loser = player
 
+            logger.debug("Challenge failed: actor has the card, challenger loses")
+            actor.putback(card)
+            actor.draw()
+        else:
+            loser = actor
             logger.debug(
-                "Challenge result: challenger=%s, loser=%s",
-                chl.challenger.id,
-                chl.loser.id,
+                "Challenge succeeded: actor doesn't have the card, actor loses"
             )
 
-            return ChallengeResolve(player=loser, act=self.act, challenge=chl)
+        chl = ChallengeInfo(type="action", challenger=player, loser=loser)
 
-        raise InvalidState("Action not handled for this state")
+        logger.debug(
+            "Challenge result: challenger=%s, loser=%s",
+            chl.challenger.id,
+            chl.loser.id,
+        )
+
+        return ChallengeResolve(player=loser, act=self.act, challenge=chl)
+
+    _STEP = {
+        ACTION.CHALLENGE_PASS: _pass,
+        ACTION.CHALLENGE_CALL: _call,
+    }
 
 
 @dataclass(frozen=True, slots=True)
@@ -334,7 +390,7 @@ class ChallengeResolve:
 
     def step(self, action: Action, *_) -> Any:
         card = action.card
-        assert card
+        assert card is not None
 
         logger.debug("Challenge resolve: player=%s loses %s", self.player.id, card.name)
 
@@ -343,7 +399,7 @@ class ChallengeResolve:
         if self.challenge.loser == self.act.actor:
             logger.debug("Challenge loser was actor, ending turn")
 
-            return EndTurn(act=self.act, challenge=self.challenge)
+            return EndTurn.from_state(self)
 
         if self.act.action == ACTION.TAX:
             logger.debug("Tax action proceeding after challenge")
@@ -356,7 +412,7 @@ class ChallengeResolve:
                 self.act.actor.coins,
             )
 
-            return EndTurn(act=self.act, challenge=self.challenge)
+            return EndTurn.from_state(self)
 
         if self.act.action == ACTION.EXCHANGE:
             logger.debug("Exchange action proceeding after challenge")
@@ -371,12 +427,12 @@ class ChallengeResolve:
 
             resolve_steal(self.act)
 
-            return EndTurn(act=self.act, challenge=self.challenge)
+            return EndTurn.from_state(self)
 
         if self.act.action == ACTION.ASSASSINATE and not self.act.target.alive:
             logger.debug("Assassinate action with dead target, ending turn")
 
-            return EndTurn(act=self.act, challenge=self.challenge)
+            return EndTurn.from_state(self)
 
         if self.act.action.block:
             logger.debug("Moving to target block phase after challenge")
@@ -386,9 +442,12 @@ class ChallengeResolve:
         raise InvalidState("Action not handled for this state")
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class ForeignAidBlock:
-    """State where players can block a foreign aid action."""
+    """State where players can block a foreign aid action.
+
+    Not frozen: passes move ``player`` to the next alive player in place.
+    """
 
     player: Player
     act: ActInfo
@@ -399,37 +458,50 @@ class ForeignAidBlock:
         return block_mask(self.act.action)
 
     def step(self, action: Action, *_) -> Any:
+        logger.debug(
+            "ForeignAidBlock: player=%s action=%s", self.player.id, action.name
+        )
+
+        handler = self._STEP.get(action)
+        if handler is None:
+            raise InvalidState("Action not handled for this state")
+
+        return handler(self, action)
+
+    def _pass(self, _action: Action) -> Any:
         player = self.player
-        logger.debug("ForeignAidBlock: player=%s action=%s", player.id, action.name)
 
-        if action == ACTION.BLOCK_PASS:
-            player.block_passed = True
-            logger.debug("Block passed by %s", player.id)
+        player.block_passed = True
+        logger.debug("Block passed by %s", player.id)
 
-            if self.player.next_alive == self.act.actor:
-                self.act.actor.coins += 2
+        if player.next_alive == self.act.actor:
+            self.act.actor.coins += 2
 
-                logger.debug(
-                    "Foreign Aid successful: %s gains 2 coins, now has %d",
-                    self.act.actor.id,
-                    self.act.actor.coins,
-                )
+            logger.debug(
+                "Foreign Aid successful: %s gains 2 coins, now has %d",
+                self.act.actor.id,
+                self.act.actor.coins,
+            )
 
-                return EndTurn(act=self.act, challenge=self.challenge)
+            return EndTurn.from_state(self)
 
-            logger.debug("Moving block to next player")
+        logger.debug("Moving block to next player")
 
-            return replace(self, player=self.player.next_alive)
+        self.player = player.next_alive
+        return self
 
-        if action == ACTION.BLOCK_FOREIGN_AID:
-            logger.debug("Foreign Aid blocked by %s", player.id)
+    def _block(self, action: Action) -> BlockChallenge:
+        logger.debug("Foreign Aid blocked by %s", self.player.id)
 
-            block = BlockInfo(blocker=self.player, action=ACTION.BLOCK_FOREIGN_AID)
-            return BlockChallenge(
-                player=self.player, act=self.act, challenge=self.challenge, block=block
-            )
+        block = BlockInfo(blocker=self.player, action=action)
+        return BlockChallenge(
+            player=self.player, act=self.act, challenge=self.challenge, block=block
+        )
 
-        raise InvalidState("Action not handled for this state")
+    _STEP = {
+        ACTION.BLOCK_PASS: _pass,
+        ACTION.BLOCK_FOREIGN_AID: _block,
+    }
 
 
 @dataclass(frozen=True, slots=True)
@@ -445,41 +517,56 @@ class TargetBlock:
         return block_mask(self.act.action)
 
     def step(self, action: Action, *_) -> Any:
-        player = self.player
+        logger.debug("TargetBlock: player=%s action=%s", self.player.id, action.name)
 
-        logger.debug("TargetBlock: player=%s action=%s", player.id, action.name)
+        handler = self._STEP.get(action)
+        if handler is None:
+            raise InvalidState("Action not handled for this state")
 
-        if action == ACTION.BLOCK_PASS:
-            player.block_passed = True
+        return handler(self, action)
 
-            logger.debug("Block passed by %s", player.id)
+    def _pass(self, _action: Action) -> Any:
+        self.player.block_passed = True
 
-            if self.act.action == ACTION.STEAL:
-                logger.debug("Steal action proceeding after block pass")
+        logger.debug("Block passed by %s", self.player.id)
 
-                resolve_steal(self.act)
-                return EndTurn(act=self.act, challenge=self.challenge)
-            if self.act.action == ACTION.ASSASSINATE:
-                logger.debug("Assassinate action proceeding after block pass")
+        if self.act.action == ACTION.STEAL:
+            logger.debug("Steal action proceeding after block pass")
 
-                return ActionResolve(
-                    player=self.act.target, act=self.act, challenge=self.challenge
-                )
+            resolve_steal(self.act)
+            return EndTurn.from_state(self)
 
-        else:
-            logger.debug("Action blocked by %s with %s", player.id, action.name)
+        if self.act.action == ACTION.ASSASSINATE:
+            logger.debug("Assassinate action proceeding after block pass")
 
-            block = BlockInfo(blocker=self.player, action=action)
-            return BlockChallenge(
-                player=self.player, act=self.act, challenge=self.challenge, block=block
+            return ActionResolve(
+                player=self.act.target, act=self.act, challenge=self.challenge
             )
 
         raise InvalidState("Action not handled for this state")
 
+    def _block(self, action: Action) -> BlockChallenge:
+        logger.debug("Action blocked by %s with %s", self.player.id, action.name)
 
-@dataclass(frozen=True, slots=True)
+        block = BlockInfo(blocker=self.player, action=action)
+        return BlockChallenge(
+            player=self.player, act=self.act, challenge=self.challenge, block=block
+        )
+
+    _STEP = {
+        ACTION.BLOCK_PASS: _pass,
+        ACTION.BLOCK_ASSASSINATE: _block,
+        ACTION.BLOCK_STEAL_AMB: _block,
+        ACTION.BLOCK_STEAL_CAP: _block,
+    }
+
+
+@dataclass(slots=True)
 class BlockChallenge:
-    """State where players can challenge a block."""
+    """State where players can challenge a block.
+
+    Not frozen: passes move ``player`` to the next alive player in place.
+    """
 
     player: Player
 
@@ -492,64 +579,76 @@ class BlockChallenge:
         return challenge_mask()
 
     def step(self, action: Action, *_) -> Any:
-        player = self.player
+        logger.debug("BlockChallenge: player=%s action=%s", self.player.id, action.name)
 
-        logger.debug("BlockChallenge: player=%s action=%s", player.id, action.name)
+        handler = self._STEP.get(action)
+        if handler is None:
+            raise InvalidState("Action not handled for this state")
 
-        if action == ACTION.CHALLENGE_PASS:
-            player.challenge_passed = True
+        return handler(self)
 
-            logger.debug("Block challenge passed by %s", player.id)
-
-            if self.player.next_alive == self.act.actor:
-                logger.debug("Block challenge phase complete")
+    def _pass(self) -> Any:
+        player = self.player
 
-                return EndTurn(act=self.act, challenge=self.challenge, block=self.block)
+        player.challenge_passed = True
 
-            logger.debug("Moving block challenge to next player")
+        logger.debug("Block challenge passed by %s", player.id)
 
-            return replace(self, player=self.player.next_alive)
+        if player.next_alive == self.act.actor:
+            logger.debug("Block challenge phase complete")
 
-        if action == ACTION.CHALLENGE_CALL:
-            logger.debug("Block challenge called by %s", player.id)
+            return EndTurn.from_state(self)
 
-            blocker = self.block.blocker
-            card = self.block.action.card
-            assert card
+        logger.debug("Moving block challenge to next player")
 
-            if blocker.cards[card]:
-                loser = player
+        self.player = player.next_alive
+        return self
 
-                logger.debug(
-                    "Block challenge failed: blocker has the card, challenger loses"
-                )
+    def _call(self) -> BlockChallengeResolve:
+        player = self.player
 
-                blocker.putback(card)
-                blocker.draw()
-            else:
-                loser = blocker
+        logger.debug("Block challenge called by %s", player.id)
 
-                logger.debug(
-                    "Block challenge succeeded: blocker doesn't have the card, blocker loses"
-                )
+        blocker = self.block.blocker
+        card = self.block.action.card
+        assert card is not None
 
-            chl = ChallengeInfo(type="block", challenger=self.player, loser=loser)
+        if blocker.cards[card]:
+            loser = player
 
             logger.debug(
-                "Block challenge result: challenger=%s, loser=%s",
-                chl.challenger.id,
-                chl.loser.id,
+                "Block challenge failed: blocker has the card, challenger loses"
             )
 
-            return BlockChallengeResolve(
-                player=loser,
-                act=self.act,
-                challenge=self.challenge,
-                block=self.block,
-                block_challenge=chl,
+            blocker.putback(card)
+            blocker.draw()
+        else:
+            loser = blocker
+
+            logger.debug(
+                "Block challenge succeeded: blocker doesn't have the card, blocker loses"
             )
 
-        raise InvalidState("Action not handled for this state")
+        chl = ChallengeInfo(type="block", challenger=player, loser=loser)
+
+        logger.debug(
+            "Block challenge result: challenger=%s, loser=%s",
+            chl.challenger.id,
+            chl.loser.id,
+        )
+
+        return BlockChallengeResolve(
+            player=loser,
+            act=self.act,
+            challenge=self.challenge,
+            block=self.block,
+            block_challenge=chl,
+        )
+
+    _STEP = {
+        ACTION.CHALLENGE_PASS: _pass,
+        ACTION.CHALLENGE_CALL: _call,
+    }
 
 
 @dataclass(frozen=True, slots=True)
@@ -569,7 +668,7 @@ class BlockChallengeResolve:
 
     def step(self, action: Action, *_) -> Any:
         card = action.card
-        assert card
+        assert card is not None
 
         logger.debug(
             "BlockChallengeResolve: player=%s loses %s", self.player.id, card.name
@@ -577,10 +676,10 @@ class BlockChallengeResolve:
 
         self.player.lose(card)
 
-        if self.block_challenge.loser == self.block_challenge.challenger:
+        if self.block_challenge.failed:
             logger.debug("Block challenge loser was challenger, ending turn")
 
-            return self.toEndTurn()
+            return EndTurn.from_state(self)
 
         if self.act.action == ACTION.FOREIGN_AID:
             self.act.actor.coins += 2
@@ -590,19 +689,19 @@ class BlockChallengeResolve:
                 self.act.actor.coins,
             )
 
-            return self.toEndTurn()
+            return EndTurn.from_state(self)
 
         if self.act.action == ACTION.STEAL:
             logger.debug("Steal action proceeding after block challenge")
 
             resolve_steal(self.act)
-            return self.toEndTurn()
+            return EndTurn.from_state(self)
 
         if self.act.action == ACTION.ASSASSINATE:
             if not self.act.target.alive:
                 logger.debug("Assassinate action with dead target, ending turn")
 
-                return self.toEndTurn()
+                return EndTurn.from_state(self)
 
             logger.debug("Assassinate action proceeding after block challenge")
 
@@ -616,15 +715,6 @@ class BlockChallengeResolve:
 
         raise InvalidState("Action not handled for this state")
 
-    def toEndTurn(self) -> EndTurn:
-        """Create an EndTurn state with all current context."""
-        return EndTurn(
-            act=self.act,
-            challenge=self.challenge,
-            block=self.block,
-            block_challenge=self.block_challenge,
-        )
-
 
 @dataclass(frozen=True, slots=True)
 class ActionResolve:
@@ -643,7 +733,7 @@ class ActionResolve:
 
     def step(self, action: Action, *_) -> EndTurn:
         card = action.card
-        assert card
+        assert card is not None
 
         logger.debug("ActionResolve: player=%s loses %s", self.player.id, card.name)
 
@@ -651,12 +741,7 @@ class ActionResolve:
 
         logger.debug("Action resolved, ending turn")
 
-        return EndTurn(
-            act=self.act,
-            challenge=self.challenge,
-            block=self.block,
-            block_challenge=self.block_challenge,
-        )
+        return EndTurn.from_state(self)
 
 
 @dataclass(frozen=True, slots=True)
@@ -672,7 +757,7 @@ class ExchangeResolve:
 
     def step(self, action: Action, *_) -> ExchangeTwoResolve:
         card = action.card
-        assert card
+        assert card is not None
 
         logger.debug(
             "ExchangeResolve: player=%s puts back %s", self.player.id, card.name
@@ -700,7 +785,7 @@ class ExchangeTwoResolve:
 
     def step(self, action: Action, *_) -> EndTurn:
         card = action.card
-        assert card
+        assert card is not None
 
         logger.debug(
             "ExchangeTwoResolve: player=%s puts back %s", self.player.id, card.name
@@ -710,12 +795,16 @@ class ExchangeTwoResolve:
 
         logger.debug("Second exchange card resolved, ending turn")
 
-        return EndTurn(act=self.act, challenge=self.challenge)
+        return EndTurn.from_state(self)
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class EndTurn:
-    """State marking the end of a turn, before moving to the next player."""
+    """State marking the end of a turn, before moving to the next player.
+
+    Not frozen: the env hands the turn to eliminated players and the winner by
+    setting ``_player`` in place.
+    """
 
     act: ActInfo
     challenge: ChallengeInfo | None = None
@@ -725,6 +814,16 @@ class EndTurn:
 
     _player: Player | None = None
 
+    @classmethod
+    def from_state(cls, state: Any) -> EndTurn:
+        """End the turn of a state, carrying over the turn context it holds."""
+        return cls(
+            act=state.act,
+            challenge=getattr(state, "challenge", None),
+            block=getattr(state, "block", None),
+            block_challenge=getattr(state, "block_challenge", None),
+        )
+
     @property
     def player(self) -> Player:
         if self._player:
@@ -735,7 +834,7 @@ class EndTurn:
         raise NotImplementedError
 
     def action_mask(self) -> ActionMask:
-        return []
+        return EMPTY_MASK
 
 
 @dataclass(frozen=True, slots=True)
@@ -750,7 +849,7 @@ class GameOver:
         return self
 
     def action_mask(self) -> ActionMask:
-        return []
+        return EMPTY_MASK
 
 
 Any = (
@@ -769,8 +868,15 @@ Any = (
 )
 
 
-def observation_space(num_players: int, max_card_count: int) -> list[dict]:
-    return [
+@functools.lru_cache(maxsize=16)
+def observation_space(
+    num_players: int, max_card_count: int
+) -> tuple[Mapping[str, int | str], ...]:
+    """Describe the parts of the observation array in order.
+
+    The records are cached per game shape and are read-only.
+    """
+    records = [
         {
             "type": "Counts",
             "desc": "Coins of each player",
@@ -783,7 +889,7 @@ def observation_space(num_players: int, max_card_count: int) -> list[dict]:
             "type": "Counts",
             "desc": "Unseen card totals",
             "max": max_card_count,
-            "size": len(CARD),
+            "size": NUM_CARDS,
             "size_desc": "# Card types",
             "scope": "Private",
         },
@@ -791,7 +897,7 @@ def observation_space(num_players: int, max_card_count: int) -> list[dict]:
             "type": "Counts",
             "desc": "Player's cards by type",
             "max": max_card_count,
-            "size": len(CARD),
+            "size": NUM_CARDS,
             "size_desc": "# Card types",
             "scope": "Private",
         },
@@ -807,7 +913,7 @@ def observation_space(num_players: int, max_card_count: int) -> list[dict]:
             "type": "One-hot",
             "desc": "Action",
             "max": 1,
-            "size": len(START_ACTION),
+            "size": LEN_START_ACTION,
             "size_desc": "# Start Actions",
             "scope": "Public",
         },
@@ -855,7 +961,7 @@ def observation_space(num_players: int, max_card_count: int) -> list[dict]:
             "type": "One-hot",
             "desc": "Block action",
             "max": 1,
-            "size": len(BLOCK_ACTION),
+            "size": LEN_BLOCK_ACTION,
             "size_desc": "# Block Actions",
             "scope": "Public",
         },
@@ -900,3 +1006,5 @@ def observation_space(num_players: int, max_card_count: int) -> list[dict]:
             "scope": "Public",
         },
     ]
+
+    return tuple(MappingProxyType(record) for record in records)
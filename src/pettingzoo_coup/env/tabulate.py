@@ -6,29 +6,21 @@ def to_markdown(data: list[dict]) -> str:
 
     headers = list(data[0].keys())
 
-    str_rows = []
-    for record in data:
-        str_rows.append([str(record.get(key, "")) for key in headers])
-
+    # stringify the cells and measure the columns in one pass
     column_widths = [max(len(header), 3) for header in headers]
 
-    for row in str_rows:
+    str_rows = []
+    for record in data:
+        row = [str(record.get(key, "")) for key in headers]
         for i, cell in enumerate(row):
-            column_widths[i] = max(column_widths[i], len(cell))
-
-    header_cells = [
-        f" {headers[i].ljust(column_widths[i])} " for i in range(len(headers))
-    ]
-    markdown_header = "| " + " | ".join(header_cells) + " |"
+            if len(cell) > column_widths[i]:
+                column_widths[i] = len(cell)
+        str_rows.append(row)
 
-    separator_cells = ["-" * column_widths[i] for i in range(len(headers))]
-    markdown_separator = "|--" + "--|--".join(separator_cells) + "--|"
+    row_format = "|  " + "  |  ".join(f"{{:<{w}}}" for w in column_widths) + "  |"
 
-    markdown_rows = []
-    for row in str_rows:
-        data_cells = [
-            f" {row[i].ljust(column_widths[i])} " for i in range(len(headers))
-        ]
-        markdown_rows.append("| " + " | ".join(data_cells) + " |")
+    lines = [row_format.format(*headers)]
+    lines.append("|--" + "--|--".join("-" * w for w in column_widths) + "--|")
+    lines.extend(row_format.format(*row) for row in str_rows)
 
-    return markdown_header + "\n" + markdown_separator + "\n" + "\n".join(markdown_rows)
+    return "\n".join(lines)
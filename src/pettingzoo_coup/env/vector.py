@@ -0,0 +1,138 @@
+"""Batch of independent Coup games stepped together."""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+from gymnasium.vector.utils import batch_space
+
+from pettingzoo_coup.env.env import raw_env
+
+logger = logging.getLogger(__name__)
+
+
+class CoupVecEnv:
+    """Steps many Coup games at once with batched observations and masks.
+
+    Each game exposes the observation and action mask of its acting agent.
+    Eliminated agents are stepped out automatically and finished games are
+    reset in place, so every call to ``step`` takes one action per game.
+
+    Spaces are named as in Gymnasium's VectorEnv: ``single_observation_space``
+    and ``single_action_space`` are those of one agent, ``observation_space``
+    and ``action_space`` those of the batch. Resets differ from Gymnasium's
+    autoreset modes: a finished game is reset within the same ``step``, which
+    returns the first observation of the new game, and the final observation
+    of the finished game is not kept.
+    """
+
+    def __init__(self, num_envs: int, **kwargs):
+        if num_envs < 1:
+            raise ValueError(f"{num_envs=} must be positive")
+
+        kwargs.setdefault("render_mode", None)
+        kwargs.setdefault("record_history", False)
+
+        self.num_envs: int = num_envs
+        self.envs: list[raw_env] = [raw_env(**kwargs) for _ in range(num_envs)]
+
+        first = self.envs[0]
+        self.possible_agents: list = first.possible_agents
+        self.num_players: int = len(first.possible_agents)
+
+        # seat of each agent, the same for all games
+        self._seat: dict = {agent: i for i, agent in enumerate(self.possible_agents)}
+
+        self.single_observation_space = first.observation_space(self.possible_agents[0])
+        self.single_action_space = first.action_space(self.possible_agents[0])
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+        ### BATCH BUFFERS ###
+
+        self.observations: np.ndarray = np.zeros(
+            (num_envs, first.obs_size), dtype=np.int8
+        )
+        self.action_masks: np.ndarray = np.zeros(
+            (num_envs, len(first.acts)), dtype=np.int8
+        )
+
+        # seat of the acting agent of each game
+        self.agent_seats: np.ndarray = np.zeros(num_envs, dtype=np.intp)
+
+        # rewards per seat and end of game flags of the last step
+        self.rewards: np.ndarray = np.zeros(
+            (num_envs, self.num_players), dtype=np.float32
+        )
+        self.terminations: np.ndarray = np.zeros(num_envs, dtype=bool)
+        self.truncations: np.ndarray = np.zeros(num_envs, dtype=bool)
+
+    def reset(self, seed: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Reset all games and return their observations and action masks."""
+
+        for i, env in enumerate(self.envs):
+            env.reset(seed=None if seed is None else seed + i)
+            self._collect(i)
+
+        self.rewards.fill(0)
+        self.terminations.fill(False)
+        self.truncations.fill(False)
+
+        return self.observations, self.action_masks
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Take one action in every game.
+
+        Returns the observations, rewards per seat, terminations, truncations
+        and action masks. A terminated game has already been reset, and its
+        observation and mask belong to the new game.
+        """
+
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+
+        self.rewards.fill(0)
+        self.terminations.fill(False)
+
+        for i, env in enumerate(self.envs):
+            env.step(int(actions[i]))
+
+            # step out eliminated agents, including the winner at game end
+            while env.agents and env.terminations[env.agent_selection]:
+                agent = env.agent_selection
+                self.rewards[i, self._seat[agent]] = env.rewards[agent]
+                env.step(None)
+
+            if not env.agents:
+                logger.debug("Game %d of batch finished, resetting", i)
+                self.terminations[i] = True
+                env.reset()
+
+            self._collect(i)
+
+        return (
+            self.observations,
+            self.rewards,
+            self.terminations,
+            self.truncations,
+            self.action_masks,
+        )
+
+    def _collect(self, i: int):
+        """Write the acting agent's observation and action mask of a game."""
+
+        env = self.envs[i]
+        agent = env.agent_selection
+
+        self.agent_seats[i] = self._seat[agent]
+        env.observe(agent, out=self.observations[i])
+        env.get_action_mask(out=self.action_masks[i])
+
+    def close(self):
+        """Clean up environment resources."""
+
+        for env in self.envs:
+            env.close()
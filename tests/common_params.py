@@ -1,3 +1,6 @@
+from collections.abc import Callable, Mapping
+from typing import Any
+
 PARAM_SETS = [
     {
         "num_players": 6,
@@ -48,3 +51,38 @@ PARAM_SETS = [
         "dead_draw": True,
     },
 ]
+
+
+def params_id(params: dict) -> str:
+    """Return a short name of a parameter set, usable in test names."""
+    return f"players_{params['num_players']}_alive_{params['num_players_alive']}"
+
+
+def add_tests(
+    cls: type,
+    prefix: str,
+    run: Callable[..., Any],
+    cases: Mapping[str, dict],
+    decorator: Callable | None = None,
+):
+    """Add one test method per case to a TestCase class.
+
+    Each test is named ``{prefix}_{case name}`` and calls ``run`` with the
+    keyword arguments of its case, so runners can select and distribute the
+    cases. The decorator, if given, wraps every test, e.g. to skip it.
+    """
+    for name, kwargs in cases.items():
+        test = _case_test(run, kwargs)
+        if decorator is not None:
+            test = decorator(test)
+        setattr(cls, f"{prefix}_{name}", test)
+
+
+def _case_test(run: Callable[..., Any], kwargs: dict) -> Callable:
+    """Build a test method calling run with the given keyword arguments."""
+
+    def test(_self):
+        run(**kwargs)
+
+    test.__doc__ = run.__doc__
+    return test
@@ -1,30 +1,73 @@
 """Comprehensive tests for game mechanics and state transitions."""
 
 import unittest
-from collections import Counter
 
-from pettingzoo_coup.env.action import ACTION
-from pettingzoo_coup.env.card import CARD
+import numpy as np
+
+from pettingzoo_coup.env.action import ACTION, action_space
+from pettingzoo_coup.env.card import CARD, CARDS, NUM_CARDS
 from pettingzoo_coup.env.env import raw_env
 
+# flat action indices of the 3-player games most tests play, fixed for the
+# number of players
+ACT_IDX = {act: i for i, act in enumerate(action_space(3))}
 
-class TestBasicActions(unittest.TestCase):
-    """Test basic self-actions: Income, Tax, Foreign Aid, Exchange."""
+INCOME_IDX = ACT_IDX[(ACTION.INCOME, 0)]
+TAX_IDX = ACT_IDX[(ACTION.TAX, 0)]
+FOREIGN_AID_IDX = ACT_IDX[(ACTION.FOREIGN_AID, 0)]
+EXCHANGE_IDX = ACT_IDX[(ACTION.EXCHANGE, 0)]
+COUP_1_IDX = ACT_IDX[(ACTION.COUP, 1)]
+ASSASSINATE_1_IDX = ACT_IDX[(ACTION.ASSASSINATE, 1)]
+STEAL_1_IDX = ACT_IDX[(ACTION.STEAL, 1)]
+CHALLENGE_PASS_IDX = ACT_IDX[(ACTION.CHALLENGE_PASS, 0)]
+CHALLENGE_CALL_IDX = ACT_IDX[(ACTION.CHALLENGE_CALL, 0)]
+BLOCK_PASS_IDX = ACT_IDX[(ACTION.BLOCK_PASS, 0)]
+BLOCK_ASSASSINATE_IDX = ACT_IDX[(ACTION.BLOCK_ASSASSINATE, 0)]
+BLOCK_FOREIGN_AID_IDX = ACT_IDX[(ACTION.BLOCK_FOREIGN_AID, 0)]
+BLOCK_STEAL_CAP_IDX = ACT_IDX[(ACTION.BLOCK_STEAL_CAP, 0)]
+LOSE_AMBASSADOR_IDX = ACT_IDX[(ACTION.LOSE_AMBASSADOR, 0)]
+LOSE_DUKE_IDX = ACT_IDX[(ACTION.LOSE_DUKE, 0)]
+
+
+def pass_challenges(env: raw_env, n: int = 2):
+    """Let the next n players pass on challenging."""
+    for _ in range(n):
+        env.step(CHALLENGE_PASS_IDX)
+
+
+def hand(counts: dict[CARD, int]) -> np.ndarray:
+    """Build a per-card count array from a card-to-count mapping."""
+    cards = np.zeros(NUM_CARDS, dtype=np.int8)
+    for card, count in counts.items():
+        cards[card] = count
+    return cards
+
+
+class EnvTestCase(unittest.TestCase):
+    """Base for tests sharing one environment per class, reset for each test."""
+
+    env_kwargs = {"num_players": 3, "num_players_alive": 3, "render_mode": None}
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the environment once for all tests of the class."""
+        cls.env = raw_env(**cls.env_kwargs)
 
     def setUp(self):
-        """Create a standard 3-player environment for testing."""
-        self.env = raw_env(num_players=3, num_players_alive=3, render_mode=None)
+        """Start every test from the same seeded game."""
         self.env.reset(seed=42)
 
+
+class TestBasicActions(EnvTestCase):
+    """Test basic self-actions: Income, Tax, Foreign Aid, Exchange."""
+
     def test_income_action(self):
         """Test that Income action gives 1 coin and ends turn."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
         initial_coins = player.coins
 
-        income_idx = self.env.act_to_idx[(ACTION.INCOME, 0)]
-
-        self.env.step(income_idx)
+        self.env.step(INCOME_IDX)
 
         self.assertEqual(player.coins, initial_coins + 1)
 
@@ -35,21 +78,17 @@ class TestBasicActions(unittest.TestCase):
         """Test Tax action when no one challenges."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
-        player.cards = Counter({CARD.DUKE: 2})
+        player.cards[:] = hand({CARD.DUKE: 2})
         initial_coins = player.coins
 
-        tax_idx = self.env.act_to_idx[(ACTION.TAX, 0)]
-
-        self.env.step(tax_idx)
+        self.env.step(TAX_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "Challenge")
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-
-        self.env.step(challenge_pass_idx)
+        self.env.step(CHALLENGE_PASS_IDX)
         self.assertEqual(type(self.env.turn).__name__, "Challenge")
 
-        self.env.step(challenge_pass_idx)
+        self.env.step(CHALLENGE_PASS_IDX)
 
         self.assertEqual(player.coins, initial_coins + 3)
 
@@ -62,18 +101,14 @@ class TestBasicActions(unittest.TestCase):
         player = self.env.find_player(agent)
         initial_coins = player.coins
 
-        foreign_aid_idx = self.env.act_to_idx[(ACTION.FOREIGN_AID, 0)]
-
-        self.env.step(foreign_aid_idx)
+        self.env.step(FOREIGN_AID_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "ForeignAidBlock")
 
-        block_pass_idx = self.env.act_to_idx[(ACTION.BLOCK_PASS, 0)]
-
-        self.env.step(block_pass_idx)
+        self.env.step(BLOCK_PASS_IDX)
         self.assertEqual(type(self.env.turn).__name__, "ForeignAidBlock")
 
-        self.env.step(block_pass_idx)
+        self.env.step(BLOCK_PASS_IDX)
 
         self.assertEqual(player.coins, initial_coins + 2)
 
@@ -86,23 +121,18 @@ class TestBasicActions(unittest.TestCase):
         player = self.env.find_player(agent)
         initial_coins = player.coins
 
-        foreign_aid_idx = self.env.act_to_idx[(ACTION.FOREIGN_AID, 0)]
-
-        self.env.step(foreign_aid_idx)
+        self.env.step(FOREIGN_AID_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "ForeignAidBlock")
 
-        block_idx = self.env.act_to_idx[(ACTION.BLOCK_FOREIGN_AID, 0)]
-        self.env.step(block_idx)
+        self.env.step(BLOCK_FOREIGN_AID_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "BlockChallenge")
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-
-        self.env.step(challenge_pass_idx)
+        self.env.step(CHALLENGE_PASS_IDX)
         self.assertEqual(type(self.env.turn).__name__, "BlockChallenge")
 
-        self.env.step(challenge_pass_idx)
+        self.env.step(CHALLENGE_PASS_IDX)
 
         self.assertEqual(player.coins, initial_coins)
 
@@ -110,14 +140,9 @@ class TestBasicActions(unittest.TestCase):
         self.assertNotEqual(self.env.agent_selection, agent)
 
 
-class TestTargetedActions(unittest.TestCase):
+class TestTargetedActions(EnvTestCase):
     """Test targeted actions: Coup, Assassinate, Steal."""
 
-    def setUp(self):
-        """Create a standard 3-player environment for testing."""
-        self.env = raw_env(num_players=3, num_players_alive=3, render_mode=None)
-        self.env.reset(seed=42)
-
     def test_coup_action(self):
         """Test Coup action (forces target to lose a card)."""
         agent = self.env.agent_selection
@@ -125,22 +150,19 @@ class TestTargetedActions(unittest.TestCase):
         player.coins = 7
 
         target = player.next_alive
-        target.cards = Counter({CARD.DUKE: 2})
-        initial_target_cards = target.cards.total()
-
-        coup_idx = self.env.act_to_idx[(ACTION.COUP, 1)]
+        target.cards[:] = hand({CARD.DUKE: 2})
+        initial_target_cards = target.cards.sum()
 
-        self.env.step(coup_idx)
+        self.env.step(COUP_1_IDX)
 
         self.assertEqual(player.coins, 0)
 
         self.assertEqual(type(self.env.turn).__name__, "ActionResolve")
         self.assertEqual(self.env.turn.player.id, target.id)
 
-        lose_duke_idx = self.env.act_to_idx[(ACTION.LOSE_DUKE, 0)]
-        self.env.step(lose_duke_idx)
+        self.env.step(LOSE_DUKE_IDX)
 
-        self.assertEqual(target.cards.total(), initial_target_cards - 1)
+        self.assertEqual(target.cards.sum(), initial_target_cards - 1)
 
         self.assertEqual(type(self.env.turn).__name__, "Start")
         self.assertNotEqual(self.env.agent_selection, agent)
@@ -150,37 +172,29 @@ class TestTargetedActions(unittest.TestCase):
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
         player.coins = 3
-        player.cards = Counter({CARD.ASSASSIN: 2})
+        player.cards[:] = hand({CARD.ASSASSIN: 2})
 
         target = player.next_alive
-        target.cards = Counter({CARD.DUKE: 2})
-        initial_target_cards = target.cards.total()
-
-        assassinate_idx = self.env.act_to_idx[(ACTION.ASSASSINATE, 1)]
+        target.cards[:] = hand({CARD.DUKE: 2})
+        initial_target_cards = target.cards.sum()
 
-        self.env.step(assassinate_idx)
+        self.env.step(ASSASSINATE_1_IDX)
 
         self.assertEqual(player.coins, 0)
 
         self.assertEqual(type(self.env.turn).__name__, "Challenge")
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-
-        self.env.step(challenge_pass_idx)
-
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
         self.assertEqual(type(self.env.turn).__name__, "TargetBlock")
 
-        block_pass_idx = self.env.act_to_idx[(ACTION.BLOCK_PASS, 0)]
-        self.env.step(block_pass_idx)
+        self.env.step(BLOCK_PASS_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "ActionResolve")
 
-        lose_duke_idx = self.env.act_to_idx[(ACTION.LOSE_DUKE, 0)]
-        self.env.step(lose_duke_idx)
+        self.env.step(LOSE_DUKE_IDX)
 
-        self.assertEqual(target.cards.total(), initial_target_cards - 1)
+        self.assertEqual(target.cards.sum(), initial_target_cards - 1)
 
         self.assertEqual(type(self.env.turn).__name__, "Start")
         self.assertNotEqual(self.env.agent_selection, agent)
@@ -189,29 +203,22 @@ class TestTargetedActions(unittest.TestCase):
         """Test Steal action when not blocked."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
-        player.cards = Counter({CARD.CAPTAIN: 2})
+        player.cards[:] = hand({CARD.CAPTAIN: 2})
         initial_coins = player.coins
 
         target = player.next_alive
         target.coins = 5
         initial_target_coins = target.coins
 
-        steal_idx = self.env.act_to_idx[(ACTION.STEAL, 1)]
-
-        self.env.step(steal_idx)
+        self.env.step(STEAL_1_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "Challenge")
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-
-        self.env.step(challenge_pass_idx)
-
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
         self.assertEqual(type(self.env.turn).__name__, "TargetBlock")
 
-        block_pass_idx = self.env.act_to_idx[(ACTION.BLOCK_PASS, 0)]
-        self.env.step(block_pass_idx)
+        self.env.step(BLOCK_PASS_IDX)
 
         self.assertEqual(player.coins, initial_coins + 2)
         self.assertEqual(target.coins, initial_target_coins - 2)
@@ -220,37 +227,28 @@ class TestTargetedActions(unittest.TestCase):
         self.assertNotEqual(self.env.agent_selection, agent)
 
 
-class TestChallenges(unittest.TestCase):
+class TestChallenges(EnvTestCase):
     """Test challenge mechanics for actions."""
 
-    def setUp(self):
-        """Create a standard 3-player environment for testing."""
-        self.env = raw_env(num_players=3, num_players_alive=3, render_mode=None)
-        self.env.reset(seed=42)
-
     def test_successful_challenge(self):
         """Test successful challenge (actor doesn't have the card)."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
-        player.cards = Counter({CARD.AMBASSADOR: 2})
-        initial_cards = player.cards.total()
+        player.cards[:] = hand({CARD.AMBASSADOR: 2})
+        initial_cards = player.cards.sum()
 
-        tax_idx = self.env.act_to_idx[(ACTION.TAX, 0)]
-
-        self.env.step(tax_idx)
+        self.env.step(TAX_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "Challenge")
 
-        challenge_call_idx = self.env.act_to_idx[(ACTION.CHALLENGE_CALL, 0)]
-        self.env.step(challenge_call_idx)
+        self.env.step(CHALLENGE_CALL_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "ChallengeResolve")
         self.assertEqual(self.env.turn.player.id, player.id)
 
-        lose_amb_idx = self.env.act_to_idx[(ACTION.LOSE_AMBASSADOR, 0)]
-        self.env.step(lose_amb_idx)
+        self.env.step(LOSE_AMBASSADOR_IDX)
 
-        self.assertEqual(player.cards.total(), initial_cards - 1)
+        self.assertEqual(player.cards.sum(), initial_cards - 1)
 
         self.assertEqual(type(self.env.turn).__name__, "Start")
         self.assertNotEqual(self.env.agent_selection, agent)
@@ -259,71 +257,79 @@ class TestChallenges(unittest.TestCase):
         """Test failed challenge (actor DOES have the card)."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
-        player.cards = Counter({CARD.DUKE: 2})
+        player.cards[:] = hand({CARD.DUKE: 2})
         initial_coins = player.coins
 
         challenger = player.next_alive
-        challenger.cards = Counter({CARD.AMBASSADOR: 2})
-        initial_challenger_cards = challenger.cards.total()
-
-        tax_idx = self.env.act_to_idx[(ACTION.TAX, 0)]
+        challenger.cards[:] = hand({CARD.AMBASSADOR: 2})
+        initial_challenger_cards = challenger.cards.sum()
 
-        self.env.step(tax_idx)
+        self.env.step(TAX_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "Challenge")
 
-        challenge_call_idx = self.env.act_to_idx[(ACTION.CHALLENGE_CALL, 0)]
-        self.env.step(challenge_call_idx)
+        self.env.step(CHALLENGE_CALL_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "ChallengeResolve")
         self.assertEqual(self.env.turn.player.id, challenger.id)
 
-        lose_amb_idx = self.env.act_to_idx[(ACTION.LOSE_AMBASSADOR, 0)]
-        self.env.step(lose_amb_idx)
+        self.env.step(LOSE_AMBASSADOR_IDX)
 
-        self.assertEqual(challenger.cards.total(), initial_challenger_cards - 1)
+        self.assertEqual(challenger.cards.sum(), initial_challenger_cards - 1)
 
         self.assertEqual(player.coins, initial_coins + 3)
 
         self.assertEqual(type(self.env.turn).__name__, "Start")
         self.assertNotEqual(self.env.agent_selection, agent)
 
+    def test_eliminated_player_sees_pass_flags_cleared(self):
+        """Test that a player eliminated by a challenge sees no pass flags."""
+        agent = self.env.agent_selection
+        player = self.env.find_player(agent)
+        player.cards[:] = hand({CARD.AMBASSADOR: 1})
 
-class TestBlocks(unittest.TestCase):
-    """Test block mechanics for targeted actions."""
+        self.env.step(TAX_IDX)
+        self.env.step(CHALLENGE_PASS_IDX)
+        self.env.step(CHALLENGE_CALL_IDX)
+        self.env.step(LOSE_AMBASSADOR_IDX)
 
-    def setUp(self):
-        """Create a standard 3-player environment for testing."""
-        self.env = raw_env(num_players=3, num_players_alive=3, render_mode=None)
-        self.env.reset(seed=42)
+        self.assertFalse(player.alive)
+        self.assertEqual(self.env.agent_selection, agent)
+
+        # all pass flags are cleared at the end of the turn, while the
+        # challenger and loser of the turn are still observed
+        n = len(self.env.possible_agents)
+        challenge = self.env.observe(agent)[self.env._obs_challenge]
+        np.testing.assert_array_equal(challenge[:n], 0)
+        self.assertEqual(challenge[n : 2 * n].sum(), 1)
+        self.assertEqual(challenge[2 * n], 1)
+
+
+class TestBlocks(EnvTestCase):
+    """Test block mechanics for targeted actions."""
 
     def test_assassinate_blocked(self):
         """Test Assassinate blocked by Contessa."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
         player.coins = 3
-        player.cards = Counter({CARD.ASSASSIN: 2})
+        player.cards[:] = hand({CARD.ASSASSIN: 2})
 
         target = player.next_alive
-        target.cards = Counter({CARD.CONTESSA: 2})
-        initial_target_cards = target.cards.total()
+        target.cards[:] = hand({CARD.CONTESSA: 2})
+        initial_target_cards = target.cards.sum()
 
-        assassinate_idx = self.env.act_to_idx[(ACTION.ASSASSINATE, 1)]
-        self.env.step(assassinate_idx)
+        self.env.step(ASSASSINATE_1_IDX)
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-        self.env.step(challenge_pass_idx)
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
-        block_idx = self.env.act_to_idx[(ACTION.BLOCK_ASSASSINATE, 0)]
-        self.env.step(block_idx)
+        self.env.step(BLOCK_ASSASSINATE_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "BlockChallenge")
 
-        self.env.step(challenge_pass_idx)
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
-        self.assertEqual(target.cards.total(), initial_target_cards)
+        self.assertEqual(target.cards.sum(), initial_target_cards)
 
         self.assertEqual(type(self.env.turn).__name__, "Start")
         self.assertNotEqual(self.env.agent_selection, agent)
@@ -332,28 +338,23 @@ class TestBlocks(unittest.TestCase):
         """Test Steal blocked by Captain."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
-        player.cards = Counter({CARD.CAPTAIN: 2})
+        player.cards[:] = hand({CARD.CAPTAIN: 2})
         initial_coins = player.coins
 
         target = player.next_alive
-        target.cards = Counter({CARD.CAPTAIN: 2})
+        target.cards[:] = hand({CARD.CAPTAIN: 2})
         target.coins = 5
         initial_target_coins = target.coins
 
-        steal_idx = self.env.act_to_idx[(ACTION.STEAL, 1)]
-        self.env.step(steal_idx)
+        self.env.step(STEAL_1_IDX)
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-        self.env.step(challenge_pass_idx)
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
-        block_idx = self.env.act_to_idx[(ACTION.BLOCK_STEAL_CAP, 0)]
-        self.env.step(block_idx)
+        self.env.step(BLOCK_STEAL_CAP_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "BlockChallenge")
 
-        self.env.step(challenge_pass_idx)
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
         self.assertEqual(player.coins, initial_coins)
         self.assertEqual(target.coins, initial_target_coins)
@@ -362,57 +363,45 @@ class TestBlocks(unittest.TestCase):
         self.assertNotEqual(self.env.agent_selection, agent)
 
 
-class TestBlockChallenges(unittest.TestCase):
+class TestBlockChallenges(EnvTestCase):
     """Test block challenge mechanics."""
 
-    def setUp(self):
-        """Create a standard 3-player environment for testing."""
-        self.env = raw_env(num_players=3, num_players_alive=3, render_mode=None)
-        self.env.reset(seed=42)
-
     def test_successful_block_challenge(self):
         """Test successful block challenge (blocker doesn't have card)."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
         player.coins = 3
-        player.cards = Counter({CARD.ASSASSIN: 2})
+        player.cards[:] = hand({CARD.ASSASSIN: 2})
 
         target = player.next_alive
-        target.cards = Counter({CARD.DUKE: 2})  # Doesn't have Contessa!
-        initial_target_cards = target.cards.total()
+        target.cards[:] = hand({CARD.DUKE: 2})  # Doesn't have Contessa!
+        initial_target_cards = target.cards.sum()
 
-        assassinate_idx = self.env.act_to_idx[(ACTION.ASSASSINATE, 1)]
-        self.env.step(assassinate_idx)
+        self.env.step(ASSASSINATE_1_IDX)
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-        self.env.step(challenge_pass_idx)
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
-        block_idx = self.env.act_to_idx[(ACTION.BLOCK_ASSASSINATE, 0)]
-        self.env.step(block_idx)
+        self.env.step(BLOCK_ASSASSINATE_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "BlockChallenge")
         self.assertEqual(self.env.agent_selection, target.id)
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-        self.env.step(challenge_pass_idx)
+        self.env.step(CHALLENGE_PASS_IDX)
 
-        challenge_call_idx = self.env.act_to_idx[(ACTION.CHALLENGE_CALL, 0)]
-        self.env.step(challenge_call_idx)
+        self.env.step(CHALLENGE_CALL_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "BlockChallengeResolve")
         self.assertEqual(self.env.turn.player.id, target.id)
 
-        lose_duke_idx = self.env.act_to_idx[(ACTION.LOSE_DUKE, 0)]
-        self.env.step(lose_duke_idx)
+        self.env.step(LOSE_DUKE_IDX)
 
-        self.assertEqual(target.cards.total(), initial_target_cards - 1)
+        self.assertEqual(target.cards.sum(), initial_target_cards - 1)
 
         self.assertEqual(type(self.env.turn).__name__, "ActionResolve")
 
-        self.env.step(lose_duke_idx)
+        self.env.step(LOSE_DUKE_IDX)
 
-        self.assertEqual(target.cards.total(), initial_target_cards - 2)
+        self.assertEqual(target.cards.sum(), initial_target_cards - 2)
 
         self.assertEqual(type(self.env.turn).__name__, "EndTurn")
         self.assertFalse(target.alive)
@@ -426,116 +415,96 @@ class TestBlockChallenges(unittest.TestCase):
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
         player.coins = 3
-        player.cards = Counter({CARD.ASSASSIN: 2})
+        player.cards[:] = hand({CARD.ASSASSIN: 2})
 
         target = player.next_alive
-        target.cards = Counter({CARD.CONTESSA: 2})
-        initial_target_cards = target.cards.total()
+        target.cards[:] = hand({CARD.CONTESSA: 2})
+        initial_target_cards = target.cards.sum()
 
-        assassinate_idx = self.env.act_to_idx[(ACTION.ASSASSINATE, 1)]
-        self.env.step(assassinate_idx)
+        self.env.step(ASSASSINATE_1_IDX)
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-        self.env.step(challenge_pass_idx)
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
-        block_idx = self.env.act_to_idx[(ACTION.BLOCK_ASSASSINATE, 0)]
-        self.env.step(block_idx)
+        self.env.step(BLOCK_ASSASSINATE_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "BlockChallenge")
         self.assertEqual(self.env.agent_selection, target.id)
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-        self.env.step(challenge_pass_idx)
+        self.env.step(CHALLENGE_PASS_IDX)
 
         third_player = target.next_alive
-        challenge_call_idx = self.env.act_to_idx[(ACTION.CHALLENGE_CALL, 0)]
-        self.env.step(challenge_call_idx)
+        self.env.step(CHALLENGE_CALL_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "BlockChallengeResolve")
         self.assertEqual(self.env.turn.player.id, third_player.id)
-        initial_third_cards = third_player.cards.total()
+        initial_third_cards = third_player.cards.sum()
 
-        third_card = next(iter(third_player.cards.elements()))
+        third_card = CARDS[np.flatnonzero(third_player.cards)[0]]
         lose_card_action = getattr(ACTION, f"LOSE_{third_card.name}")
-        lose_idx = self.env.act_to_idx[(lose_card_action, 0)]
+        lose_idx = ACT_IDX[(lose_card_action, 0)]
         self.env.step(lose_idx)
 
-        self.assertEqual(third_player.cards.total(), initial_third_cards - 1)
+        self.assertEqual(third_player.cards.sum(), initial_third_cards - 1)
 
-        self.assertEqual(target.cards.total(), initial_target_cards)
+        self.assertEqual(target.cards.sum(), initial_target_cards)
 
         self.assertEqual(type(self.env.turn).__name__, "Start")
         self.assertNotEqual(self.env.agent_selection, agent)
 
 
-class TestExchange(unittest.TestCase):
+class TestExchange(EnvTestCase):
     """Test Exchange action mechanics."""
 
-    def setUp(self):
-        """Create a standard 3-player environment for testing."""
-        self.env = raw_env(num_players=3, num_players_alive=3, render_mode=None)
-        self.env.reset(seed=42)
-
     def test_exchange_no_challenge(self):
         """Test Exchange action when not challenged."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
-        player.cards = Counter({CARD.AMBASSADOR: 2})
-
-        exchange_idx = self.env.act_to_idx[(ACTION.EXCHANGE, 0)]
+        player.cards[:] = hand({CARD.AMBASSADOR: 2})
 
-        self.env.step(exchange_idx)
+        self.env.step(EXCHANGE_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "Challenge")
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-        self.env.step(challenge_pass_idx)
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
         self.assertEqual(type(self.env.turn).__name__, "ExchangeResolve")
 
-        self.assertEqual(player.cards.total(), 4)
+        self.assertEqual(player.cards.sum(), 4)
 
-        lose_amb_idx = self.env.act_to_idx[(ACTION.LOSE_AMBASSADOR, 0)]
-        self.env.step(lose_amb_idx)
+        self.env.step(LOSE_AMBASSADOR_IDX)
 
         self.assertEqual(type(self.env.turn).__name__, "ExchangeTwoResolve")
-        self.assertEqual(player.cards.total(), 3)
+        self.assertEqual(player.cards.sum(), 3)
 
-        self.env.step(lose_amb_idx)
+        self.env.step(LOSE_AMBASSADOR_IDX)
 
-        self.assertEqual(player.cards.total(), 2)
+        self.assertEqual(player.cards.sum(), 2)
 
         self.assertEqual(type(self.env.turn).__name__, "Start")
         self.assertNotEqual(self.env.agent_selection, agent)
 
 
-class TestGameEnd(unittest.TestCase):
+class TestGameEnd(EnvTestCase):
     """Test game end conditions."""
 
-    def setUp(self):
-        """Create a 2-player environment for testing."""
-        self.env = raw_env(num_players=2, num_players_alive=2, render_mode=None)
-        self.env.reset(seed=42)
+    env_kwargs = {"num_players": 2, "num_players_alive": 2, "render_mode": None}
 
     def test_game_ends_when_one_player_left(self):
         """Test game ends when only one player has cards."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
         player.coins = 7
-        player.cards = Counter({CARD.DUKE: 1})
+        player.cards[:] = hand({CARD.DUKE: 1})
 
         target = player.next_alive
-        target.cards = Counter({CARD.AMBASSADOR: 1})
+        target.cards[:] = hand({CARD.AMBASSADOR: 1})
 
-        coup_idx = self.env.act_to_idx[(ACTION.COUP, 1)]
-        self.env.step(coup_idx)
+        # target indices depend on the number of players
+        self.env.step(self.env.act_to_idx[(ACTION.COUP, 1)])
 
         self.assertEqual(type(self.env.turn).__name__, "ActionResolve")
 
-        lose_amb_idx = self.env.act_to_idx[(ACTION.LOSE_AMBASSADOR, 0)]
-        self.env.step(lose_amb_idx)
+        self.env.step(LOSE_AMBASSADOR_IDX)
 
         self.assertFalse(target.alive)
 
@@ -547,46 +516,36 @@ class TestGameEnd(unittest.TestCase):
         self.assertEqual(self.env.agents[0], player.id)
 
 
-class TestEdgeCases(unittest.TestCase):
+class TestEdgeCases(EnvTestCase):
     """Test edge cases and special situations."""
 
-    def setUp(self):
-        """Create a standard 3-player environment for testing."""
-        self.env = raw_env(num_players=3, num_players_alive=3, render_mode=None)
-        self.env.reset(seed=42)
-
     def test_steal_from_target_with_no_coins(self):
         """Test that stealing from a player with 0 coins is not allowed."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
-        player.cards = Counter({CARD.CAPTAIN: 2})
+        player.cards[:] = hand({CARD.CAPTAIN: 2})
 
         target = player.next_alive
         target.coins = 0
 
-        steal_idx = self.env.act_to_idx[(ACTION.STEAL, 1)]
         action_mask = self.env.get_action_mask()
-        self.assertFalse(action_mask[steal_idx])
+        self.assertFalse(action_mask[STEAL_1_IDX])
 
     def test_steal_from_target_with_one_coin(self):
         """Test stealing from a player with only 1 coin."""
         agent = self.env.agent_selection
         player = self.env.find_player(agent)
-        player.cards = Counter({CARD.CAPTAIN: 2})
+        player.cards[:] = hand({CARD.CAPTAIN: 2})
         initial_coins = player.coins
 
         target = player.next_alive
         target.coins = 1
 
-        steal_idx = self.env.act_to_idx[(ACTION.STEAL, 1)]
-        self.env.step(steal_idx)
+        self.env.step(STEAL_1_IDX)
 
-        challenge_pass_idx = self.env.act_to_idx[(ACTION.CHALLENGE_PASS, 0)]
-        self.env.step(challenge_pass_idx)
-        self.env.step(challenge_pass_idx)
+        pass_challenges(self.env)
 
-        block_pass_idx = self.env.act_to_idx[(ACTION.BLOCK_PASS, 0)]
-        self.env.step(block_pass_idx)
+        self.env.step(BLOCK_PASS_IDX)
 
         self.assertEqual(player.coins, initial_coins + 1)
         self.assertEqual(target.coins, 0)
@@ -599,11 +558,110 @@ class TestEdgeCases(unittest.TestCase):
 
         action_mask = self.env.get_action_mask()
 
-        income_idx = self.env.act_to_idx[(ACTION.INCOME, 0)]
-        self.assertFalse(action_mask[income_idx])
+        self.assertFalse(action_mask[INCOME_IDX])
+
+        self.assertTrue(action_mask[COUP_1_IDX])
+
+
+class TestSeeding(unittest.TestCase):
+    """Test that each environment draws from its own random generator."""
+
+    def test_seed_independent_of_global_state(self):
+        """Test that equal seeds deal equal games regardless of other draws."""
+        env1 = raw_env(num_players=3, num_players_alive=3, render_mode=None)
+        env2 = raw_env(num_players=3, num_players_alive=3, render_mode=None)
+
+        np.random.seed(0)
+        env1.reset(seed=42)
+
+        np.random.seed(1)
+        env2.reset(seed=7)
+        env2.reset(seed=42)
+
+        np.testing.assert_array_equal(env1.cards, env2.cards)
+        self.assertEqual(env1.agent_selection, env2.agent_selection)
+
+
+class TestObservationHistory(EnvTestCase):
+    """Test the per-turn observation history."""
+
+    def test_history_grows_per_turn(self):
+        """Test that each alive agent gets one observation per finished turn."""
+        env = self.env
+
+        # enough turns to grow the history buffer
+        for n_turn in range(1, 41):
+            env.find_player(env.agent_selection).coins = 0
+            env.step(INCOME_IDX)
+
+            for agent in env.agents:
+                history = env.infos[agent]["observation_history"]
+                self.assertEqual(history.shape, (n_turn, env.obs_size))
+                self.assertFalse(history.flags.writeable)
+
+                # first entry of the observation is the observer's coins
+                player = env.find_player(agent)
+                self.assertEqual(history[-1][0], player.coins)
+
+    def test_history_disabled(self):
+        """Test that no history is recorded when disabled."""
+        env = raw_env(
+            num_players=3, num_players_alive=3, render_mode=None, record_history=False
+        )
+        env.reset(seed=42)
+
+        env.step(INCOME_IDX)
+
+        for agent in env.agents:
+            self.assertNotIn("observation_history", env.infos[agent])
+
+    def test_observe_all_matches_observe(self):
+        """Test that batched observations match the per-agent observations."""
+        env = raw_env(num_players=4, num_players_alive=4, render_mode=None)
+        env.reset(seed=7)
+        rng = np.random.default_rng(7)
+
+        for _ in env.agent_iter(max_iter=300):
+            observations = env.observe_all()
+            for row, other in zip(observations, env.agents, strict=True):
+                np.testing.assert_array_equal(row, env.observe(other))
+
+            _, _, termination, truncation, info = env.last()
+
+            if termination or truncation:
+                action = None
+            else:
+                action = rng.choice(np.flatnonzero(info["action_mask"]))
+
+            env.step(action)
+
+
+class TestActionMask(unittest.TestCase):
+    """Test the precomputed action mask against the state action lists."""
+
+    def test_mask_matches_state_actions(self):
+        """Test that the action mask matches the actions listed by each state."""
+        env = raw_env(num_players=4, num_players_alive=4, render_mode=None)
+
+        for seed in range(5):
+            env.reset(seed=seed)
+            rng = np.random.default_rng(seed)
+
+            for _ in env.agent_iter(max_iter=500):
+                _, _, termination, truncation, info = env.last()
+
+                expected = np.zeros(len(env.acts), dtype=np.int8)
+                for act, tgt in env.turn.action_mask():
+                    expected[env.act_to_idx[(act, tgt)]] = 1
+
+                np.testing.assert_array_equal(info["action_mask"], expected)
+
+                if termination or truncation:
+                    action = None
+                else:
+                    action = rng.choice(np.flatnonzero(info["action_mask"]))
 
-        coup_idx = self.env.act_to_idx[(ACTION.COUP, 1)]
-        self.assertTrue(action_mask[coup_idx])
+                env.step(action)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,17 @@
 import logging
+import os
 import unittest
 from pathlib import Path
 
+import numpy as np
+
 from pettingzoo_coup import coup_v0
-from tests.common_params import PARAM_SETS
+from tests.common_params import PARAM_SETS, add_tests, params_id
 
 SEEDS = list(range(10))
 LOG_DIR = Path("logs")
+# game states are rendered into the logs only at DEBUG level
+LOG_LEVEL = os.environ.get("COUP_TEST_LOGLEVEL", "INFO").upper()
 
 
 def setup_logging(params, seed):
@@ -30,43 +35,55 @@ def setup_logging(params, seed):
     formatter = logging.Formatter("%(message)s")
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(LOG_LEVEL)
 
     return file_handler
 
 
 def run(seed, **kwargs):
+    """Run the game and capture logs to separate files."""
     setup_logging(kwargs, seed)
 
     env = coup_v0.env(**kwargs)
 
     env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
 
-    logging.debug(env.render())
+    # rendering is costly, skip it unless the render is logged
+    log_render = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if log_render:
+        logging.debug(env.render())
 
-    for agent in env.agent_iter():
+    for _ in env.agent_iter():
         _, _, termination, truncation, info = env.last()
 
         if termination or truncation:
             action = None
         else:
-            action_mask = info.get("action_mask", None)
-            action = env.action_space(agent).sample(action_mask)
+            action = rng.choice(np.flatnonzero(info["action_mask"]))
 
         env.step(action)
 
-        logging.debug(env.render())
+        if log_render:
+            logging.debug(env.render())
 
     env.close()
 
 
 class TestLoggedRun(unittest.TestCase):
-    def test_logged_run(self):
-        """Run the game and capture logs to separate files."""
-        for params in PARAM_SETS:
-            for seed in SEEDS:
-                with self.subTest(params=params, seed=seed):
-                    run(seed=seed, **params)
+    """Seeded games with logs, one test per parameter set and seed added below."""
+
+
+add_tests(
+    TestLoggedRun,
+    "test_logged_run",
+    run,
+    {
+        f"{params_id(params)}_seed_{seed}": {"seed": seed, **params}
+        for params in PARAM_SETS
+        for seed in SEEDS
+    },
+)
 
 
 if __name__ == "__main__":
@@ -1,22 +1,48 @@
+import os
 import unittest
 
 from pettingzoo.test import api_test, seed_test
 
 from pettingzoo_coup import coup_v0
-from tests.common_params import PARAM_SETS
+from tests.common_params import PARAM_SETS, add_tests, params_id
 
+# long API runs are skipped unless COUP_TEST_SLOW is set
+RUN_SLOW = bool(os.environ.get("COUP_TEST_SLOW"))
+FAST_CYCLES = 50
+SLOW_CYCLES = 1_000
 
-class TestPettingZooAPI(unittest.TestCase):
-    def test_api_compliance(self):
-        """Test that the environment complies with PettingZoo API standards."""
-        for params in PARAM_SETS:
-            with self.subTest(params=params):
-                api_test(coup_v0.env(**params), num_cycles=1_000)
 
+class TestPettingZooAPI(unittest.TestCase):
     def test_seed_consistency(self):
         """Test that the environment produces consistent results with the same seed."""
         seed_test(coup_v0.env, num_cycles=1_000)
 
 
+def check_api(params, num_cycles):
+    """Test that the environment complies with PettingZoo API standards."""
+    api_test(coup_v0.env(**params), num_cycles=num_cycles)
+
+
+add_tests(
+    TestPettingZooAPI,
+    "test_api_compliance",
+    check_api,
+    {
+        params_id(params): {"params": params, "num_cycles": FAST_CYCLES}
+        for params in PARAM_SETS
+    },
+)
+add_tests(
+    TestPettingZooAPI,
+    "test_api_compliance_slow",
+    check_api,
+    {
+        params_id(params): {"params": params, "num_cycles": SLOW_CYCLES}
+        for params in PARAM_SETS
+    },
+    decorator=unittest.skipUnless(RUN_SLOW, "set COUP_TEST_SLOW=1 to run"),
+)
+
+
 if __name__ == "__main__":
     unittest.main()
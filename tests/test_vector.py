@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+
+from pettingzoo_coup import coup_v0
+
+
+class TestCoupVecEnv(unittest.TestCase):
+    def setUp(self):
+        self.vec = coup_v0.CoupVecEnv(num_envs=4, num_players=3, num_players_alive=3)
+
+    def test_reset_shapes(self):
+        """Test that reset fills one observation and mask per game."""
+        observations, action_masks = self.vec.reset(seed=0)
+
+        self.assertEqual(observations.shape, (4, self.vec.envs[0].obs_size))
+        self.assertEqual(observations.shape, self.vec.observation_space.shape)
+        self.assertEqual(action_masks.shape, (4, self.vec.single_action_space.n))
+        self.assertTrue(action_masks.any(axis=1).all())
+
+    def test_games_finish_and_reset(self):
+        """Test that finished games pay the winner and restart."""
+        _, action_masks = self.vec.reset(seed=0)
+        rng = np.random.default_rng(0)
+
+        games = 0
+        for _ in range(1_000):
+            actions = [rng.choice(np.flatnonzero(mask)) for mask in action_masks]
+            _, rewards, terminations, _, action_masks = self.vec.step(np.array(actions))
+
+            np.testing.assert_array_equal(rewards.sum(axis=1), terminations)
+            self.assertTrue(action_masks.any(axis=1).all())
+
+            games += int(terminations.sum())
+
+        self.assertGreater(games, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()